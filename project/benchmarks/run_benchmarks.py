@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for the classifier and parser hot paths.
+
+Builds synthetic columns of configurable size and cardinality from the bundled data files, times
+FeatureExtractor.extract_features, Classifier.classify_column, ParserUtils.parse_phone_number,
+ParserUtils.parse_company_name and the full parser.py pipeline, and writes rows/sec, p50/p99
+per-value latency and peak RSS to a JSON file. Pass --compare with an earlier results file to
+print the speed ratio of every benchmark against it.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from project.utils.classifier import Classifier, FeatureExtractor
+from project.utils.data_loader import DATA_DIR
+from project.utils.ml_backend import label_pools
+from project.utils.parser_utils import ParserUtils
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_OUTPUT = Path("bench_results.json")
+
+def source_pools():
+    """Distinct example values per semantic type, taken from the data files."""
+    pools = label_pools()
+    return {"phone": pools["PhoneNumber"], "company": pools["CompanyName"], "date": pools["Date"], "country": pools["Country"]}
+
+def synthetic_column(pool, rows, cardinality, rng):
+    """`rows` values drawn with replacement from `cardinality` distinct values of the pool."""
+    distinct = rng.choice(pool, size=min(cardinality, len(pool)), replace=False)
+    return pd.Series(rng.choice(distinct, size=rows), dtype=object)
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(who).ru_maxrss / scale
+
+def time_batch(func, rows, repeat):
+    """Best-of-`repeat` wall time of func() processing `rows` values."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return {"rows": rows, "seconds": best, "rows_per_sec": rows / best if best else None}
+
+def time_per_value(func, values):
+    """p50/p99 latency (microseconds) of func on each value individually."""
+    latencies = np.empty(len(values))
+    for i, value in enumerate(values):
+        start = time.perf_counter_ns()
+        func(value)
+        latencies[i] = (time.perf_counter_ns() - start) / 1000
+    return {"p50_us": float(np.percentile(latencies, 50)), "p99_us": float(np.percentile(latencies, 99))}
+
+def run_pipeline(columns, workdir, extra_args):
+    """Run parser.py end to end in a subprocess and measure wall time and its peak RSS."""
+    input_path = Path(workdir) / "bench_input.csv"
+    output_path = Path(workdir) / "bench_output.csv"
+    pd.DataFrame(columns).to_csv(input_path, index=False)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(REPO_ROOT), os.environ.get("PYTHONPATH", "")]))
+    cmd = [sys.executable, "-m", "project.parser", "--input", str(input_path), "--output", str(output_path)] + extra_args
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"parser.py failed: {proc.stderr.strip()}")
+    rows = len(next(iter(columns.values())))
+    return {"rows": rows, "seconds": seconds, "rows_per_sec": rows / seconds,
+            "peak_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN), "args": extra_args}
+
+def compare(results, baseline_path):
+    baseline = json.loads(Path(baseline_path).read_text())["benchmarks"]
+    print(f"\nComparison against {baseline_path} (>1.00 is faster now):")
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("rows_per_sec")
+        if before and result.get("rows_per_sec"):
+            print(f"  {name.ljust(40)} {result['rows_per_sec'] / before:6.2f}x")
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark classifier and parser hot paths.")
+    p.add_argument("--rows", type=int, default=100000, help="Rows per synthetic column")
+    p.add_argument("--cardinality", type=int, default=5000, help="Distinct values per synthetic column")
+    p.add_argument("--latency-sample", type=int, default=2000, help="Values timed individually for p50/p99")
+    p.add_argument("--repeat", type=int, default=3, help="Repetitions per batch benchmark (best is kept)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--skip-pipeline", action="store_true", help="Do not run parser.py end to end")
+    p.add_argument("--pipeline-args", default="", help="Extra arguments for the parser.py run, e.g. '--chunksize 50000'")
+    p.add_argument("--output", "-o", default=str(DEFAULT_OUTPUT), help="Where to write the JSON results")
+    p.add_argument("--compare", help="Earlier results file to compare against")
+    args = p.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    columns = {name: synthetic_column(pool, args.rows, args.cardinality, rng) for name, pool in source_pools().items()}
+    feature_extractor = FeatureExtractor()
+    classifier = Classifier(feature_extractor)
+    parser_utils = ParserUtils()
+
+    # Warm up lazily built state (compiled patterns, phone metadata) outside the timed regions
+    for name, values in columns.items():
+        feature_extractor.extract_features(values.iloc[:10])
+    parser_utils.parse_phone_number(columns["phone"].iloc[0])
+
+    results = {}
+    for name, values in columns.items():
+        results[f"extract_features[{name}]"] = time_batch(lambda: feature_extractor.extract_features(values), len(values), args.repeat)
+        results[f"classify_column[{name}]"] = time_batch(lambda: classifier.classify_column(values), len(values), args.repeat)
+        results[f"classify_column[{name}]"]["peak_rss_mb"] = peak_rss_mb()
+        print(f"[INFO] {name}: classified as {classifier.classify_column(values)[0]}")
+
+    latency_values = {name: values.iloc[:args.latency_sample].tolist() for name, values in columns.items()}
+    results["_calculate_features_for_value[company]"] = {
+        **time_batch(lambda: [feature_extractor._calculate_features_for_value(v) for v in latency_values["company"]],
+                     len(latency_values["company"]), 1),
+        **time_per_value(feature_extractor._calculate_features_for_value, latency_values["company"]),
+    }
+    for method, kind in (("parse_phone_number", "phone"), ("parse_company_name", "company")):
+        func = getattr(parser_utils, method)
+        values = columns[kind]
+        results[f"{method}[loop]"] = {
+            **time_batch(lambda: [func(v) for v in values], len(values), 1),
+            **time_per_value(func, latency_values[kind]),
+        }
+        results[f"{method}[map_unique]"] = time_batch(lambda: parser_utils.map_unique(values, method), len(values), args.repeat)
+        results[f"{method}[map_unique]"]["peak_rss_mb"] = peak_rss_mb()
+    results["parse_phone_numbers[batch]"] = time_batch(
+        lambda: parser_utils.parse_phone_numbers(columns["phone"], infer_region=False), len(columns["phone"]), args.repeat)
+    results["parse_company_names[batch]"] = time_batch(
+        lambda: parser_utils.parse_company_names(columns["company"]), len(columns["company"]), args.repeat)
+
+    if not args.skip_pipeline:
+        with tempfile.TemporaryDirectory() as workdir:
+            results["parser.py"] = run_pipeline(columns, workdir, args.pipeline_args.split())
+
+    for name, result in results.items():
+        latency = f"  p50 {result['p50_us']:8.1f}us  p99 {result['p99_us']:8.1f}us" if "p50_us" in result else ""
+        print(f"{name.ljust(40)} {result['rows_per_sec']:12,.0f} rows/s{latency}")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"rows": args.rows, "cardinality": args.cardinality, "latency_sample": args.latency_sample,
+                   "repeat": args.repeat, "seed": args.seed, "data_dir": DATA_DIR},
+        "peak_rss_mb": peak_rss_mb(),
+        "benchmarks": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"\nSaved results to {Path(args.output).resolve()}")
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -1,98 +1,452 @@
 import pandas as pd
 import argparse
+import cProfile
+import functools
+import os
+import time
 import joblib
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
 
 # Import Classifier from Part A and ParserUtils from updated utils
+from project.utils.checkpoint import RunCheckpoint, input_fingerprint
+from project.utils.classification_cache import DEFAULT_TOLERANCE, ClassificationCache, classify_with_cache, model_key
 from project.utils.classifier import Classifier
-from project.utils.parser_utils import ParserUtils
+from project.utils.column_profile import ColumnProfile
+from project.utils.parser_utils import DEFAULT_PHONE_REGION, ParserUtils
+from project.utils.parallel import ParallelParser, ParallelClassifier
+from project.utils.profiling import StageProfiler
+from project.utils.output_writer import ChunkWriter, OUTPUT_FORMATS
+from project.utils.input_reader import (
+    INPUT_ENGINES, RANGE_SIZE, csv_row_ranges, is_parquet, iter_table, read_columns, read_csv_range, read_table,
+)
 
 MODEL_PATH = Path("models/classifier.pkl")
 CONFIDENCE_THRESHOLD = 0.6 # Using a default threshold, can be adjusted
+DETECT_ROWS = 10000 # Leading rows used for type detection in streaming mode
 
-def main():
-    parser = argparse.ArgumentParser(description="Parse Phone Number and Company Name columns from a CSV.")
-    parser.add_argument("--input", "-i", required=True, help="Path to the input CSV file.")
-    parser.add_argument("--output", "-o", default="output.csv", help="Path to the output CSV file.")
-    args = parser.parse_args()
+FINAL_COLUMN_ORDER = [
+    'original_phone_number', 'parsed_country', 'parsed_phone_number',
+    'original_company_name', 'parsed_company_name', 'parsed_legal_suffix'
+]
+
+def read_input(path, columns=None, nrows=None, engine="pandas"):
+    # Every column is read as text: values are classified and parsed as strings, and reading the
+    # same file whole or in chunks then yields the same values (no per-chunk dtype inference).
+    return read_table(path, columns=columns, nrows=nrows, engine=engine)
+
+def classify_columns(clf, df, max_sample_size=None, workers=1, cache=None, spot_check=0):
+    """
+    Classify every column of df, in column order. Returns one dict per column with `label` and
+    `confidence` (plus the sampling details when max_sample_size is set), or `error`, and the
+    `seconds` spent on the column. With a ClassificationCache, columns whose fingerprint matches
+    a cached one reuse its result (optionally spot-checked on `spot_check` values) instead.
+    """
+    columns = [(col_name, df.iloc[:, i]) for i, col_name in enumerate(df.columns)]
+
+    def classify(positions):
+        if workers > 1:
+            with ParallelClassifier(workers, MODEL_PATH) as pool:
+                return pool.classify_columns([columns[i][1] for i in positions], max_sample_size)
+        results = []
+        for i in positions:
+            start = time.perf_counter()
+            try:
+                if max_sample_size:
+                    result = clf.classify_column_sampled(columns[i][1], max_sample_size=max_sample_size)
+                else:
+                    label, conf = clf.classify_column(columns[i][1])
+                    result = {"label": label, "confidence": conf}
+            except Exception as e:
+                result = {"error": str(e)}
+            result["seconds"] = time.perf_counter() - start
+            results.append(result)
+        return results
+
+    check = lambda sample: clf.classify_column(sample)[0]
+    return classify_with_cache(cache, columns, classify, check, spot_check)
+
+def profile_columns(clf, chunks):
+    """
+    Classify every column from all of its rows, streamed chunk by chunk: each chunk is folded into
+    a fixed-size ColumnProfile per column, so memory does not grow with the file. Returns results
+    like classify_columns, with `column_size` the number of values profiled.
+    """
+    profiles, seconds = {}, {}
+    for chunk in chunks:
+        for col_name in chunk.columns:
+            start = time.perf_counter()
+            if col_name not in profiles:
+                profiles[col_name] = ColumnProfile.for_extractor(clf.feature_extractor)
+            profiles[col_name].update(chunk[col_name], clf.feature_extractor)
+            seconds[col_name] = seconds.get(col_name, 0.0) + time.perf_counter() - start
+
+    results = []
+    for col_name, profile in profiles.items():
+        start = time.perf_counter()
+        try:
+            label, conf = clf.classify_profile(profile)
+            result = {"label": label, "confidence": conf, "column_size": profile.count}
+        except Exception as e:
+            result = {"error": str(e)}
+        result["seconds"] = seconds[col_name] + time.perf_counter() - start
+        results.append(result)
+    return results
+
+def detect_columns(clf, df, max_sample_size=None, workers=1, profiler=None, results=None, cache=None, spot_check=0):
+    """
+    Classify every column of df and return the best PhoneNumber/CompanyName candidates as
+    {"PhoneNumber": {"col_name": ..., "score": ...}, "CompanyName": {...}}.
+    Precomputed per-column `results` (e.g. from profile_columns) may be passed instead; `cache`
+    and `spot_check` are passed on to classify_columns.
+    Per-column timings are recorded on `profiler` when one is given.
+    """
+    best_columns = {
+        "PhoneNumber": {"col_name": None, "score": 0.0},
+        "CompanyName": {"col_name": None, "score": 0.0},
+    }
+
+    if results is None:
+        results = classify_columns(clf, df, max_sample_size, workers, cache, spot_check)
+    for col_name, result in zip(df.columns, results):
+        if profiler is not None:
+            rows = result.get("sample_size", result.get("column_size", len(df)))
+            profiler.record_column(col_name, result["seconds"], rows, result)
+        if "error" in result:
+            print(f"[WARN] Error classifying column '{col_name}': {result['error']}")
+            continue
+        label, conf = result["label"], result["confidence"]
+        if result.get("cached"):
+            print(f"[INFO] Column '{col_name}' classified as {label} with confidence {conf:.2f} "
+                  f"(cached, fingerprint similarity {result['similarity']:.2f})")
+        elif "sample_size" in result:
+            interval = f"+/-{result['ci_half_width']:.2f}, " if result.get("ci_half_width") is not None else ""
+            print(f"[INFO] Column '{col_name}' classified as {label} with confidence {conf:.2f} "
+                  f"({interval}sampled {result['sample_size']}/{result['column_size']} values)")
+        elif "column_size" in result:
+            print(f"[INFO] Column '{col_name}' classified as {label} with confidence {conf:.2f} "
+                  f"(profiled all {result['column_size']} values)")
+        else:
+            print(f"[INFO] Column '{col_name}' classified as {label} with confidence {conf:.2f}")
+        if label == "PhoneNumber" and conf > best_columns["PhoneNumber"]["score"]:
+            best_columns["PhoneNumber"]["score"] = conf
+            best_columns["PhoneNumber"]["col_name"] = col_name
+        elif label == "CompanyName" and conf > best_columns["CompanyName"]["score"]:
+            best_columns["CompanyName"]["score"] = conf
+            best_columns["CompanyName"]["col_name"] = col_name
+    return best_columns
+
+def pool_compute(method_name, pool=None):
+    # Each distinct value is parsed once; those are sharded across the worker pool when one is given
+    if pool is None:
+        return None
+    return lambda distinct: pool.map(method_name, pd.Series(distinct, dtype=object)).tolist()
+
+def parse_columns(df, phone_col, company_col, parser_utils, pool=None, profiler=None):
+    """Build the output frame for df (a whole file or one chunk) from the selected columns."""
+    results = {}
+    stage = profiler.stage if profiler is not None else lambda name, rows=None: nullcontext()
+
+    if phone_col:
+        results['original_phone_number'] = df[phone_col]
+        with stage("parse_phone", rows=len(df)):
+            # The region order was fixed once for the whole run (see select_columns), not per chunk
+            parsed_phones = parser_utils.parse_phone_numbers(df[phone_col], infer_region=False,
+                                                             compute=pool_compute("parse_phone_number", pool))
+            results.update(parsed_phones.items())
+
+    if company_col:
+        results['original_company_name'] = df[company_col]
+        with stage("parse_company", rows=len(df)):
+            parsed_companies = parser_utils.parse_company_names(df[company_col],
+                                                                compute=pool_compute("parse_company_name", pool))
+            results.update(parsed_companies.items())
+
+    output_df = pd.DataFrame(results)
+    existing_columns_in_order = [col for col in FINAL_COLUMN_ORDER if col in output_df.columns]
+    return output_df[existing_columns_in_order]
+
+def parse_ranges(path, ranges, columns, phone_col, company_col, parser_utils, pool=None):
+    """
+    Output frames of the byte ranges of a CSV file, in file order. With a pool, every worker reads
+    and parses whole ranges itself; otherwise they are read and parsed here, one after the other.
+    """
+    names = read_columns(path)
+    build = functools.partial(parse_columns, phone_col=phone_col, company_col=company_col)
+    if pool is not None:
+        yield from pool.map_ranges(path, ranges, names, columns, build)
+        return
+    for start, end in ranges:
+        yield build(read_csv_range(path, start, end, names, columns), parser_utils=parser_utils)
 
+def checkpoint_settings(args) -> dict:
+    """Settings a resumed run must share with the run that wrote the checkpoint."""
+    return {
+        "input": input_fingerprint(args.input), "output": os.path.abspath(args.output),
+        "output_format": args.output_format, "chunksize": args.chunksize, "split_input": args.split_input,
+        "range_size": args.range_size if args.split_input else None,
+        "phone_region": args.phone_region, "phone_regions": args.phone_regions,
+    }
+
+def load_detection_inputs(args, profiler, streaming):
+    """The rows used for type detection and the classifier, or None (after printing why) if either is unavailable."""
     try:
-        df = pd.read_csv(args.input)
+        # In streaming mode only a leading sample is loaded for type detection
+        with profiler.stage("load_input"):
+            df = read_input(args.input, nrows=args.detect_rows if streaming else None, engine=args.engine)
         print(f"[INFO] Successfully loaded '{args.input}'. Analyzing {len(df.columns)} columns...")
     except FileNotFoundError:
         print(f"[ERROR] Input file not found at '{args.input}'")
-        return
-    
+        return None
+    except ImportError as e:
+        print(f"[ERROR] {e}")
+        return None
+
     # Load the Part A Classifier
     if not MODEL_PATH.exists():
         print(f"[ERROR] Classifier model not found at {MODEL_PATH}. Run `python scripts/save_classifier.py` first.")
-        return
+        return None
     try:
-        clf = joblib.load(MODEL_PATH)
+        with profiler.stage("load_model"):
+            clf = joblib.load(MODEL_PATH)
         print(f"[INFO] Loaded classifier from {MODEL_PATH}.")
     except Exception as e:
         print(f"[ERROR] Failed to load classifier model: {e}")
-        return
-
-    # Instantiate ParserUtils
-    parser_utils = ParserUtils()
-    print("[INFO] Initialized ParserUtils.")
+        return None
+    return df, clf
 
-    best_columns = {
-        "PhoneNumber": {"col_name": None, "score": 0.0},
-        "CompanyName": {"col_name": None, "score": 0.0},
-    }
-
-    for col_name in df.columns:
-        try:
-            label, conf = clf.classify_column(df[col_name])
-            print(f"[INFO] Column '{col_name}' classified as {label} with confidence {conf:.2f}")
-            if label == "PhoneNumber" and conf > best_columns["PhoneNumber"]["score"]:
-                best_columns["PhoneNumber"]["score"] = conf
-                best_columns["PhoneNumber"]["col_name"] = col_name
-            elif label == "CompanyName" and conf > best_columns["CompanyName"]["score"]:
-                best_columns["CompanyName"]["score"] = conf
-                best_columns["CompanyName"]["col_name"] = col_name
-        except Exception as e:
-            print(f"[WARN] Error classifying column '{col_name}': {e}")
-    
+def select_columns(args, profiler, streaming, clf, df, parser_utils):
+    """
+    Classify the columns of df and return the (phone_col, company_col) to parse, None where no
+    column meets CONFIDENCE_THRESHOLD. With fallback phone regions, also infers the region order.
+    """
+    if streaming and args.detect_all_rows:
+        # One extra pass over the file; the detection sample still provides the column list
+        with profiler.stage("classify_columns"):
+            results = profile_columns(clf, iter_table(args.input, args.chunksize or args.detect_rows, engine=args.engine))
+            best_columns = detect_columns(clf, df, profiler=profiler, results=results)
+    else:
+        cache = None
+        if args.classification_cache:
+            cache = ClassificationCache(args.classification_cache, model_key(MODEL_PATH), args.fingerprint_tolerance)
+        with profiler.stage("classify_columns", rows=len(df) * len(df.columns)):
+            best_columns = detect_columns(clf, df, args.max_sample_size, args.workers, profiler,
+                                          cache=cache, spot_check=args.spot_check)
+        if cache is not None:
+            cache.save()
+            profiler.record_cache("classification", cache.hits, cache.misses, len(cache))
+            print(f"[INFO] Classification cache: {cache.hits} of {len(df.columns)} columns reused "
+                  f"({cache.spot_check_failures} failed spot checks).")
     phone_info = best_columns["PhoneNumber"]
     company_info = best_columns["CompanyName"]
 
     print(f"[INFO] Best candidate for Phone Number: '{phone_info['col_name']}' (Score: {phone_info['score']:.2f})")
     print(f"[INFO] Best candidate for Company Name: '{company_info['col_name']}' (Score: {company_info['score']:.2f})")
-    
-    results = {}
-    
-    if phone_info['col_name'] and phone_info['score'] >= CONFIDENCE_THRESHOLD:
-        col = phone_info['col_name']
-        results['original_phone_number'] = df[col]
-        parsed_phones = df[col].apply(parser_utils.parse_phone_number)
-        results['parsed_country'] = parsed_phones.str[0]
-        results['parsed_phone_number'] = parsed_phones.str[1]
-
-    if company_info['col_name'] and company_info['score'] >= CONFIDENCE_THRESHOLD:
-        col = company_info['col_name']
-        results['original_company_name'] = df[col]
-        parsed_companies = df[col].apply(parser_utils.parse_company_name)
-        results['parsed_company_name'] = parsed_companies.str[0]
-        results['parsed_legal_suffix'] = parsed_companies.str[1]
-    
-    if results:
-        final_column_order = [
-            'original_phone_number', 'parsed_country', 'parsed_phone_number',
-            'original_company_name', 'parsed_company_name', 'parsed_legal_suffix'
-        ]
-        
-        output_df = pd.DataFrame(results)
-        
-        existing_columns_in_order = [col for col in final_column_order if col in output_df.columns]
-        output_df = output_df[existing_columns_in_order]
-
-        output_df.to_csv(args.output, index=False)
-        print(f"\n[SUCCESS] Processing complete. Detailed '{args.output}' has been generated.")
+
+    phone_col = phone_info['col_name'] if phone_info['col_name'] and phone_info['score'] >= CONFIDENCE_THRESHOLD else None
+    company_col = company_info['col_name'] if company_info['col_name'] and company_info['score'] >= CONFIDENCE_THRESHOLD else None
+
+    if phone_col and parser_utils.fallback_regions:
+        # The region the phone column is mostly written in is tried first; it is inferred once, on the
+        # detection rows, so every chunk (and the result cache) uses the same region order
+        regions = parser_utils.phone_regions
+        parser_utils.default_region = parser_utils.infer_phone_region(df[phone_col], regions)
+        parser_utils.fallback_regions = [region for region in regions if region != parser_utils.default_region]
+        print(f"[INFO] Phone numbers are parsed as {parser_utils.default_region} numbers, "
+              f"then as {', '.join(parser_utils.fallback_regions)}.")
+    return phone_col, company_col
+
+def run(args, profiler):
+    if args.split_input and is_parquet(args.input):
+        print("[ERROR] --split-input splits CSV files; read Parquet input with --chunksize instead.")
+        return
+    streaming = args.chunksize is not None or args.split_input
+
+    checkpoint, resume = None, None
+    if args.checkpoint:
+        if not streaming or args.output_format != "csv":
+            print("[ERROR] --checkpoint needs a streaming run (--chunksize or --split-input) with CSV output.")
+            return
+        try:
+            checkpoint = RunCheckpoint(args.checkpoint, checkpoint_settings(args))
+        except FileNotFoundError:
+            print(f"[ERROR] Input file not found at '{args.input}'")
+            return
+        resume = checkpoint.load(args.output)
+
+    # A resumed run reuses the recorded classification, so neither the sample nor the model is loaded
+    df = clf = None
+    if resume is None:
+        loaded = load_detection_inputs(args, profiler, streaming)
+        if loaded is None:
+            return
+        df, clf = loaded
+
+    # Instantiate ParserUtils
+    with profiler.stage("init_parser_utils"):
+        parser_utils = ParserUtils(cache_size=args.cache_size, default_region=args.phone_region,
+                                   fallback_regions=args.phone_regions)
+    print("[INFO] Initialized ParserUtils.")
+
+    if resume is None:
+        phone_col, company_col = select_columns(args, profiler, streaming, clf, df, parser_utils)
+        if not (phone_col or company_col):
+            print(f"\n[WARN] No columns met the {CONFIDENCE_THRESHOLD:.0%} confidence threshold. No output generated.")
+            return
     else:
-        print(f"\n[WARN] No columns met the {CONFIDENCE_THRESHOLD:.0%} confidence threshold. No output generated.")
+        phone_col, company_col = resume["phone_col"], resume["company_col"]
+        parser_utils.default_region, parser_utils.fallback_regions = resume["default_region"], resume["fallback_regions"]
+        print(f"[INFO] Resuming from checkpoint '{args.checkpoint}': {resume['chunks']} chunks "
+              f"({resume['rows']} rows) already written; phone column '{phone_col}', company column '{company_col}'.")
+    done_chunks = resume["chunks"] if resume is not None else 0
+    done_rows = resume["rows"] if resume is not None else 0
+    resume_offset = resume["output_bytes"] if resume is not None and resume["output_bytes"] else None
+
+    try:
+        writer = ChunkWriter(args.output, args.output_format, resume_offset=resume_offset)
+    except (ImportError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return
+
+    def save_progress(completed):
+        if checkpoint is not None:
+            checkpoint.save(chunks=completed, rows=done_rows + writer.rows, output_bytes=writer.sync())
+
+    parser_kwargs = {"default_region": parser_utils.default_region, "fallback_regions": parser_utils.fallback_regions}
+    pool = ParallelParser(args.workers, parser_kwargs=parser_kwargs) if args.workers > 1 else None
+    if pool is not None:
+        print(f"[INFO] Parsing with {args.workers} worker processes.")
+    try:
+        with writer:
+            if not streaming:
+                output_df = parse_columns(df, phone_col, company_col, parser_utils, pool, profiler)
+                with profiler.stage("write_output", rows=len(output_df)):
+                    writer.write(output_df)
+            else:
+                # Only the selected columns are read; each chunk (or byte range) is parsed and appended to the output
+                del df
+                selected = [col for col in (phone_col, company_col) if col]
+                progress = {}
+                if args.split_input:
+                    if resume is not None and resume.get("ranges") is not None:
+                        ranges = [tuple(r) for r in resume["ranges"]]
+                    else:
+                        with profiler.stage("split_input"):
+                            ranges = csv_row_ranges(args.input, args.range_size,
+                                                    pool.executor.map if pool is not None else map)
+                        progress["ranges"] = ranges
+                if checkpoint is not None and resume is None:
+                    progress.update(phone_col=phone_col, company_col=company_col, default_region=parser_utils.default_region,
+                                    fallback_regions=parser_utils.fallback_regions, chunks=0, rows=0, output_bytes=0)
+                if checkpoint is not None and progress:
+                    # One save: a checkpoint never holds the column decision without the ranges it applies to
+                    checkpoint.save(**progress)
+                completed = done_chunks
+                if args.split_input:
+                    outputs = parse_ranges(args.input, ranges[done_chunks:], selected, phone_col, company_col,
+                                           parser_utils, pool)
+                    while True:
+                        with profiler.stage("parse_range"):
+                            output_df = next(outputs, None)
+                        if output_df is None:
+                            break
+                        with profiler.stage("write_output", rows=len(output_df)):
+                            writer.write(output_df)
+                            completed += 1
+                            save_progress(completed)
+                else:
+                    # Completed chunks of a resumed run are read again (only the selected columns) but not parsed
+                    chunks = islice(iter_table(args.input, args.chunksize, columns=selected, engine=args.engine),
+                                    done_chunks, None)
+                    while True:
+                        with profiler.stage("read_chunk"):
+                            chunk = next(chunks, None)
+                        if chunk is None:
+                            break
+                        output_df = parse_columns(chunk, phone_col, company_col, parser_utils, pool, profiler)
+                        with profiler.stage("write_output", rows=len(output_df)):
+                            writer.write(output_df)
+                            completed += 1
+                            save_progress(completed)
+                if writer.chunks == 0 and resume_offset is None:
+                    empty = read_input(args.input, columns=selected, nrows=0, engine=args.engine)
+                    writer.write(parse_columns(empty, phone_col, company_col, parser_utils))
+                if args.split_input:
+                    print(f"[INFO] Parsed {done_rows + writer.rows} rows in {len(ranges)} byte ranges of about {args.range_size} bytes.")
+                else:
+                    print(f"[INFO] Streamed {done_rows + writer.rows} rows in chunks of {args.chunksize}.")
+        if checkpoint is not None:
+            checkpoint.remove()
+    finally:
+        if pool is not None:
+            pool.close()
+        for method_name, cache in parser_utils.caches.items():
+            profiler.record_cache(method_name, cache.hits, cache.misses, len(cache))
+    print(f"\n[SUCCESS] Processing complete. Detailed '{args.output}' has been generated.")
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse Phone Number and Company Name columns from a CSV.")
+    parser.add_argument("--input", "-i", required=True, help="Path to the input CSV (or .parquet) file.")
+    parser.add_argument("--engine", choices=INPUT_ENGINES, default="pandas",
+                        help="CSV reader: pandas' C parser or the multi-threaded pyarrow reader (needs pyarrow).")
+    parser.add_argument("--output", "-o", default="output.csv", help="Path to the output file.")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv",
+                        help="csv, parquet or arrow (Arrow IPC file); the columnar formats need pyarrow.")
+    parser.add_argument("--max-sample-size", type=int, default=None,
+                        help="Classify each column on an adaptive random sample of at most this many values.")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Stream the input in chunks of this many rows; memory stays bounded by the chunk size.")
+    parser.add_argument("--split-input", action="store_true",
+                        help="Memory-map the CSV input and split it into newline-aligned byte ranges (never inside a "
+                             "quoted field) that the --workers processes read and parse in parallel; output stays in input order.")
+    parser.add_argument("--range-size", type=int, default=RANGE_SIZE,
+                        help="With --split-input, approximate size of each byte range in bytes.")
+    parser.add_argument("--detect-rows", type=int, default=DETECT_ROWS,
+                        help="In streaming mode (--chunksize or --split-input), number of leading rows used to detect column types.")
+    parser.add_argument("--detect-all-rows", action="store_true",
+                        help="In streaming mode, detect column types on every row instead of the leading --detect-rows: "
+                             "each chunk is folded into fixed-size per-column profiles (one extra pass over the file).")
+    parser.add_argument("--classification-cache", metavar="PATH", default=None,
+                        help="Persistent JSON cache of column classifications keyed by column fingerprints (name, dtype, "
+                             "MinHash of value shapes); columns of a known feed reuse the cached label and confidence.")
+    parser.add_argument("--fingerprint-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Least fingerprint similarity (0-1) at which a cached classification is reused.")
+    parser.add_argument("--spot-check", type=int, default=0, metavar="N",
+                        help="Validate every cache hit by classifying N sampled values; a different label reclassifies the column.")
+    parser.add_argument("--cache-size", type=int, default=None,
+                        help="Keep up to this many parse results per field in an LRU cache shared by all chunks.")
+    parser.add_argument("--phone-region", type=str.upper, default=DEFAULT_PHONE_REGION,
+                        help="Region whose national format is assumed for phone numbers without a country code.")
+    parser.add_argument("--phone-regions", type=lambda value: [region.strip().upper() for region in value.split(",") if region.strip()],
+                        default=None, metavar="REGIONS",
+                        help="Comma-separated alternative regions, e.g. IN,GB: the phone column's dominant region is "
+                             "inferred among --phone-region and these, and numbers invalid there are retried in the others.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes used to classify columns and parse phone and company values.")
+    parser.add_argument("--checkpoint", metavar="PATH", default=None,
+                        help="Record the column decision and progress after every chunk in this JSON sidecar; rerunning the "
+                             "same command resumes after the last completed chunk. Needs --chunksize or --split-input and CSV output.")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="Write a JSON report of per-stage wall/CPU time, per-column classification time and cache hit rates.")
+    parser.add_argument("--profile-cprofile", metavar="PATH", default=None,
+                        help="Also record a cProfile dump of the run (open it with `python -m pstats PATH` or snakeviz).")
+    args = parser.parse_args()
+
+    profiler = StageProfiler()
+    cprofiler = cProfile.Profile() if args.profile_cprofile else None
+    if cprofiler is not None:
+        cprofiler.enable()
+    try:
+        run(args, profiler)
+    finally:
+        if cprofiler is not None:
+            cprofiler.disable()
+            cprofiler.dump_stats(args.profile_cprofile)
+            print(f"[PROFILE] cProfile stats written to '{args.profile_cprofile}'.")
+        if args.profile:
+            profiler.print_summary(profiler.write(args.profile))
+            print(f"[PROFILE] Report written to '{args.profile}'.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,18 +1,102 @@
 # predict.py
 import argparse
+import glob
 import joblib
 from pathlib import Path
 import pandas as pd
 import sys
 
+from project.utils.classification_cache import DEFAULT_TOLERANCE, ClassificationCache, classify_with_cache, model_key
+from project.utils.input_reader import INPUT_ENGINES, read_columns, read_table
+
 MODEL_PATH = Path("models/classifier.pkl")
 
-def load_column_values(path: Path, column_name: str): # Renamed `path` param from `Path` to `path` 
-    df = pd.read_csv(path)
-    if column_name not in df.columns:
+def column_values(df: pd.DataFrame, column_name: str):
+    return df[column_name].astype(str).fillna("").tolist()
+
+def load_column_values(path: Path, column_name: str, engine: str = "pandas"): # Renamed `path` param from `Path` to `path` 
+    # Only the requested column is read, and as text, so no other column is parsed or type-inferred
+    if column_name not in read_columns(path):
         raise SystemExit(f"Column '{column_name}' not found in {path}")
-    vals = df[column_name].astype(str).fillna("").tolist()
-    return vals
+    return column_values(read_table(path, columns=[column_name], engine=engine), column_name)
+
+def expand_inputs(patterns=None, manifest=None):
+    """
+    Resolve the batch inputs: glob patterns from the command line plus the lines of a manifest
+    file (one path or glob per line; blank lines and lines starting with '#' are ignored).
+    Paths are returned sorted and de-duplicated within each pattern, in pattern order.
+    """
+    patterns = list(patterns or [])
+    if manifest:
+        with open(manifest, "r", encoding="utf-8") as f:
+            patterns += [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    paths = []
+    for pattern in patterns:
+        # A pattern without matches is kept as is, so that it is reported as a missing file
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+def classify_values(clf, columns, cache=None, spot_check=0):
+    """
+    Classify (name, values) columns with call_classifier_obj, reusing the results of a
+    ClassificationCache where the column fingerprints match. Returns one dict per column with
+    `label` and `confidence`, or `error`.
+    """
+    columns = [(name, pd.Series(values, dtype=object)) for name, values in columns]
+
+    def classify(positions):
+        results = []
+        for i in positions:
+            try:
+                label, conf = call_classifier_obj(clf, columns[i][1].tolist())
+                results.append({"label": label, "confidence": conf})
+            except Exception as e:
+                results.append({"error": str(e)})
+        return results
+
+    check = lambda sample: call_classifier_obj(clf, sample.tolist())[0]
+    return classify_with_cache(cache, columns, classify, check, spot_check)
+
+def classify_files(clf, paths, columns=None, nrows=None, engine="pandas", cache=None, spot_check=0):
+    """
+    Classify the columns of several CSV files with one loaded classifier.
+
+    Args:
+        clf: The loaded classifier object.
+        paths (list): CSV files to classify.
+        columns (list, optional): Only classify these columns (and only read them); by default all.
+        nrows (int, optional): Classify on at most this many leading rows per file.
+        engine (str): CSV reader, "pandas" or "pyarrow".
+        cache (ClassificationCache, optional): Reuse cached results for known columns (see classify_values).
+        spot_check (int): Validate cache hits on this many sampled values.
+
+    Returns:
+        list[dict]: One record per (file, column) with `file`, `column`, `label`, `confidence` and
+            `error`; a file that cannot be read gives one record with an empty column.
+    """
+    records = []
+    for path in paths:
+        try:
+            available = read_columns(path)
+            present = [col for col in columns if col in available] if columns else None
+            df = read_table(path, columns=present, nrows=nrows, engine=engine) if present != [] else pd.DataFrame()
+        except Exception as e:
+            records.append({"file": path, "column": "", "label": "", "confidence": None, "error": str(e)})
+            continue
+        for missing in [col for col in columns or [] if col not in available]:
+            records.append({"file": path, "column": missing, "label": "", "confidence": None,
+                            "error": "column not found"})
+        values = [(column_name, column_values(df, column_name)) for column_name in df.columns]
+        for column_name, result in zip(df.columns, classify_values(clf, values, cache, spot_check)):
+            if "error" in result:
+                records.append({"file": path, "column": column_name, "label": "", "confidence": None,
+                                "error": result["error"]})
+            else:
+                records.append({"file": path, "column": column_name, "label": result["label"],
+                                "confidence": result["confidence"], "error": ""})
+    return records
 
 def call_classifier_obj(clf, values):
     """
@@ -75,25 +159,68 @@ def call_classifier_obj(clf, values):
 
     raise RuntimeError("Could not call classifier object: unsupported interface.")
 
+def run_batch(clf, args, cache=None):
+    paths = expand_inputs(args.inputs, args.manifest)
+    if not paths:
+        print("No input files given; pass --inputs and/or --manifest.")
+        sys.exit(1)
+    columns = [col.strip() for col in args.columns.split(",") if col.strip()] if args.columns else None
+    records = classify_files(clf, paths, columns, args.nrows, args.engine, cache, args.spot_check)
+    pd.DataFrame(records, columns=["file", "column", "label", "confidence", "error"]).to_csv(args.batch_output, index=False)
+    failed = sum(1 for record in records if record["error"])
+    print(f"Classified {len(records) - failed} columns in {len(paths)} files ({failed} errors); results written to {args.batch_output}")
+
 def main():
     p = argparse.ArgumentParser()
-    p.add_argument("--input", required=True, help="Path to CSV input file")
-    p.add_argument("--column", required=True, help="Column name to classify")
+    p.add_argument("--input", help="Path to CSV input file")
+    p.add_argument("--column", help="Column name to classify")
     p.add_argument("--output-file", help="Optional path to write classification output to")
+    p.add_argument("--engine", choices=INPUT_ENGINES, default="pandas",
+                   help="CSV reader: pandas' C parser or the multi-threaded pyarrow reader (needs pyarrow). "
+                        ".parquet inputs are always read with pyarrow.")
+    p.add_argument("--classification-cache", metavar="PATH",
+                   help="Persistent JSON cache of classifications keyed by column fingerprints (name, dtype, MinHash "
+                        "of value shapes); known columns reuse the cached label and confidence.")
+    p.add_argument("--fingerprint-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                   help="Least fingerprint similarity (0-1) at which a cached classification is reused.")
+    p.add_argument("--spot-check", type=int, default=0, metavar="N",
+                   help="Validate every cache hit by classifying N sampled values.")
+    batch = p.add_argument_group("batch mode", "Classify the columns of many files in one process.")
+    batch.add_argument("--inputs", nargs="+", help="CSV/Parquet files or glob patterns, e.g. 'incoming/*.csv'")
+    batch.add_argument("--manifest", help="Text file listing one CSV path or glob per line")
+    batch.add_argument("--columns", help="Comma-separated columns to classify (default: all columns of each file)")
+    batch.add_argument("--nrows", type=int, help="Classify on at most this many leading rows per file")
+    batch.add_argument("--batch-output", default="predictions.csv",
+                       help="Consolidated results file (file, column, label, confidence, error)")
     args = p.parse_args()
 
+    batch_mode = bool(args.inputs or args.manifest)
+    if not batch_mode and not (args.input and args.column):
+        p.error("either --input and --column, or --inputs/--manifest for batch mode, are required")
+
     if not MODEL_PATH.exists():
         print(f"Model not found at {MODEL_PATH}. Run `python3 scripts/save_classifier.py` to create it.")
         sys.exit(1)
 
     clf = joblib.load(MODEL_PATH)
+    cache = None
+    if args.classification_cache:
+        cache = ClassificationCache(args.classification_cache, model_key(MODEL_PATH), args.fingerprint_tolerance)
 
-    vals = load_column_values(Path(args.input), args.column)
-    try:
-        label, conf = call_classifier_obj(clf, vals)
-    except Exception as e:
-        print("Error while calling classifier:", e)
+    if batch_mode:
+        run_batch(clf, args, cache)
+        if cache is not None:
+            cache.save()
+        return
+
+    vals = load_column_values(Path(args.input), args.column, args.engine)
+    result = classify_values(clf, [(args.column, vals)], cache, args.spot_check)[0]
+    if "error" in result:
+        print("Error while calling classifier:", result["error"])
         sys.exit(2)
+    if cache is not None:
+        cache.save()
+    label, conf = result["label"], result["confidence"]
 
     output_string = f"{label} {conf:.2f}"
 
@@ -0,0 +1,28 @@
+# scripts/build_artifacts.py
+import sys
+
+# Import directly from project.utils
+try:
+    from project.utils.artifact_cache import ArtifactStore
+    import project.utils.artifact_cache as artifact_cache
+    from project.utils.classifier import FeatureExtractor
+    from project.utils.parser_utils import ParserUtils
+except Exception as e:
+    print(f"Error importing project modules: {e}")
+    print("Please ensure your PYTHONPATH is correctly set or run this script from the project root.")
+    sys.exit(1)
+
+def main():
+    # Start from an empty store so every artifact is rebuilt from the current data files
+    store = ArtifactStore()
+    store.entries = {}
+    artifact_cache._default_store = store
+
+    # Constructing the consumers builds and persists every artifact they use
+    FeatureExtractor()
+    ParserUtils()
+    print(f"Built {len(store.entries)} artifacts ({', '.join(sorted(store.entries))})")
+    print(f"Saved artifact cache to: {store.path} (key {store.key[:12]})")
+
+if __name__ == "__main__":
+    main()
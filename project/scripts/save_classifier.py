@@ -5,8 +5,6 @@ import joblib
 
 # Import directly from project.utils
 try:
-    from project.utils.data_loader import (GLOBAL_COUNTRIES_SET, GLOBAL_LEGAL_SUFFIXES_SET, 
-                                         GLOBAL_COMPANY_DF, GLOBAL_DATES_DF, GLOBAL_PHONE_NUMBERS_DF)
     from project.utils.classifier import FeatureExtractor, Classifier
 except Exception as e:
     print(f"Error importing project modules: {e}")
@@ -11,7 +11,9 @@ from pathlib import Path
 import pandas as pd
 import sys
 
-MODEL_PATHS = [Path("models/classifier.pkl"), Path("models/classifier_rf.pkl")]
+from project.utils.classification_cache import DEFAULT_TOLERANCE, ClassificationCache, classify_with_cache, model_key
+
+MODEL_PATHS = [Path("models/classifier.pkl"), Path("models/classifier_ml.pkl"), Path("models/classifier_rf.pkl")]
 DEFAULT_INPUT = Path("data/test.csv")
 DEFAULT_OUTPUT = Path("output/part_a_results.csv")
 
@@ -33,7 +35,7 @@ def load_model_or_fallback():
             load_global_resources = None
 
     try:
-        from project.utils.classifier import Classifier
+        from project.utils.classifier import Classifier, FeatureExtractor
     except Exception:
         Classifier = None
 
@@ -113,6 +115,11 @@ def main():
     p.add_argument("--input", "-i", default=str(DEFAULT_INPUT), help="Path to input CSV file")
     p.add_argument("--output", "-o", default=str(DEFAULT_OUTPUT), help="Optional output CSV for results")
     p.add_argument("--no-save", action="store_true", help="Do not save results to CSV")
+    p.add_argument("--workers", type=int, default=1, help="Classify columns in this many worker processes")
+    p.add_argument("--classification-cache", help="Persistent JSON cache of classifications keyed by column fingerprints")
+    p.add_argument("--fingerprint-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                   help="Least fingerprint similarity (0-1) at which a cached classification is reused")
+    p.add_argument("--spot-check", type=int, default=0, help="Validate every cache hit by classifying this many sampled values")
     args = p.parse_args()
 
     input_path = Path(args.input)
@@ -127,15 +134,40 @@ def main():
         sys.exit(2)
 
     df = pd.read_csv(input_path, header=0)
+    columns = [(col, pd.Series(df[col].astype(str).fillna("").tolist(), dtype=object)) for col in df.columns]
+    model_path = next((p for p in MODEL_PATHS if p.exists()), None)
+
+    def classify(positions):
+        if args.workers > 1:
+            # Workers load the same saved model once each (or build the in-memory Classifier)
+            from project.utils.parallel import ParallelClassifier
+            with ParallelClassifier(args.workers, model_path) as pool:
+                return pool.classify_columns([columns[i][1] for i in positions])
+        outcomes = []
+        for i in positions:
+            try:
+                label, conf = call_classifier_obj(clf, columns[i][1].tolist())
+                outcomes.append({"label": label, "confidence": conf})
+            except Exception as e:
+                outcomes.append({"error": str(e)})
+        return outcomes
+
+    # Known columns (same name, dtype and value shapes as a cached one) are not classified again
+    cache = None
+    if args.classification_cache:
+        cache = ClassificationCache(args.classification_cache, model_key(model_path), args.fingerprint_tolerance)
+    check = lambda sample: call_classifier_obj(clf, sample.tolist())[0]
     results = []
-    for col in df.columns:
-        vals = df[col].astype(str).fillna("").tolist()
-        try:
-            label, conf = call_classifier_obj(clf, vals)
-        except Exception as e:
+    for col, outcome in zip(df.columns, classify_with_cache(cache, columns, classify, check, args.spot_check)):
+        if "error" in outcome:
             label, conf = "Error", 0.0
-            print(f"Error classifying column {col}: {e}")
+            print(f"Error classifying column {col}: {outcome['error']}")
+        else:
+            label, conf = outcome["label"], float(outcome["confidence"])
         results.append((col, label, conf))
+    if cache is not None:
+        cache.save()
+        print(f"Reused cached classifications for {cache.hits} of {len(columns)} columns.")
 
     pretty_print_table(results)
 
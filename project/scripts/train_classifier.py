@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Train the ML column classifier on synthetic columns built from the bundled data files, compare it
+with the heuristic scores (accuracy and latency on held-out columns), and save it.
+
+The saved model is a regular Classifier with a trained `ml_model`, so it is a drop-in replacement
+for models/classifier.pkl (see --output).
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+import joblib
+
+try:
+    from project.utils.classifier import FeatureExtractor, Classifier
+    from project.utils.ml_backend import MODEL_TYPES, ColumnModel, column_feature_matrix, label_pools, split_pools, training_columns
+except Exception as e:
+    print(f"Error importing project modules: {e}")
+    print("Please ensure your PYTHONPATH is correctly set or run this script from the project root.")
+    sys.exit(1)
+
+def evaluate(name, classify_batch, columns, labels):
+    """Accuracy (overall and per label) and per-column latency of one classifier on labelled columns."""
+    start = time.perf_counter()
+    predictions = classify_batch(columns)
+    seconds = time.perf_counter() - start
+    per_label = {}
+    for (predicted, _), label in zip(predictions, labels):
+        hits, total = per_label.get(label, (0, 0))
+        per_label[label] = (hits + (predicted == label), total + 1)
+    correct = sum(hits for hits, _ in per_label.values())
+    return {
+        "name": name,
+        "accuracy": correct / len(labels),
+        "per_label_accuracy": {label: hits / total for label, (hits, total) in per_label.items()},
+        "seconds": seconds,
+        "ms_per_column": 1000 * seconds / len(columns),
+    }
+
+def main():
+    p = argparse.ArgumentParser(description="Train the ML column classifier and compare it with the heuristics.")
+    p.add_argument("--model-type", choices=MODEL_TYPES, default="gbt", help="gbt (gradient-boosted trees) or logreg")
+    p.add_argument("--train-columns", type=int, default=400, help="Synthetic training columns per value pool")
+    p.add_argument("--test-columns", type=int, default=100, help="Held-out evaluation columns per value pool")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--output", default="models/classifier_ml.pkl", help="Where to save the trained classifier")
+    p.add_argument("--report", help="Optional path for a JSON report of the comparison")
+    args = p.parse_args()
+
+    # Train and test columns are drawn from disjoint halves of every pool of example values
+    train_pools, test_pools = split_pools(label_pools(args.seed), random_state=args.seed)
+    train_columns, train_labels = training_columns(train_pools, args.train_columns, random_state=args.seed)
+    test_columns, test_labels = training_columns(test_pools, args.test_columns, random_state=args.seed + 1)
+
+    feature_extractor = FeatureExtractor()
+    start = time.perf_counter()
+    X = column_feature_matrix(feature_extractor, train_columns)
+    model = ColumnModel(args.model_type, random_state=args.seed).fit(X, train_labels)
+    print(f"Trained {args.model_type} on {X.shape[0]} columns x {X.shape[1]} features in {time.perf_counter() - start:.1f}s")
+
+    heuristic = Classifier(feature_extractor)
+    trained = Classifier(feature_extractor, ml_model=model)
+    results = [
+        evaluate("heuristic", heuristic.classify_columns, test_columns, test_labels),
+        evaluate(f"ml ({args.model_type})", trained.classify_columns, test_columns, test_labels),
+    ]
+    print(f"\nHeld-out columns: {len(test_columns)}")
+    for result in results:
+        per_label = ", ".join(f"{label} {acc:.2f}" for label, acc in result["per_label_accuracy"].items())
+        print(f"  {result['name'].ljust(12)} accuracy {result['accuracy']:.3f}  {result['ms_per_column']:7.2f} ms/column  ({per_label})")
+
+    out_path = pathlib.Path(args.output)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(trained, out_path)
+    print(f"\nSaved classifier to: {out_path.resolve()}")
+    if args.report:
+        pathlib.Path(args.report).write_text(json.dumps({"model_type": args.model_type, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import sys
+import joblib
+from pathlib import Path
+
+from project.utils.parser_utils import ParserUtils
+from project.utils.service import ClassificationService, ServiceHTTPServer, UnixServiceHTTPServer
+
+MODEL_PATH = Path("models/classifier.pkl")
+
+def main():
+    p = argparse.ArgumentParser(description="Serve column classification and parsing over HTTP with a warm model.")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    p.add_argument("--port", type=int, default=8765, help="TCP port to listen on.")
+    p.add_argument("--socket", help="Listen on this Unix socket path instead of TCP.")
+    p.add_argument("--cache-size", type=int, default=100000,
+                   help="Parse results kept per field in an LRU cache shared by all requests.")
+    p.add_argument("--quiet", action="store_true", help="Do not log every request.")
+    args = p.parse_args()
+
+    if not MODEL_PATH.exists():
+        print(f"Model not found at {MODEL_PATH}. Run `python3 scripts/save_classifier.py` to create it.")
+        sys.exit(1)
+
+    service = ClassificationService(joblib.load(MODEL_PATH), ParserUtils(cache_size=args.cache_size))
+    service.warm_up()
+
+    if args.socket:
+        server = UnixServiceHTTPServer(args.socket, service, quiet=args.quiet)
+        where = f"unix:{args.socket}"
+    else:
+        server = ServiceHTTPServer((args.host, args.port), service, quiet=args.quiet)
+        where = f"http://{args.host}:{server.server_address[1]}"
+    print(f"[INFO] Serving classifier from {MODEL_PATH} on {where} (POST /classify, POST /parse, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import pytest
+from project.utils.classifier import FeatureExtractor, Classifier
+from project.utils.parser_utils import ParserUtils
+
+@pytest.fixture
+def feature_extractor():
+    # FeatureExtractor now loads global resources, so data_dir is not needed
+    return FeatureExtractor()
+
+@pytest.fixture
+def classifier(feature_extractor):
+    return Classifier(feature_extractor)
+
+@pytest.fixture
+def parser_utils():
+    # ParserUtils now loads global resources, so data_dir is not needed
+    return ParserUtils()
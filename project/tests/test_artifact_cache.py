@@ -0,0 +1,31 @@
+import pytest
+from project.utils.artifact_cache import ArtifactStore, DATA_DIR
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "legal.txt"
+    path.write_text("ltd\ngmbh\n")
+    return path
+
+def test_artifacts_persist_across_stores(tmp_path, data_file):
+    store_path = str(tmp_path / "store.pkl")
+    calls = []
+    build = lambda: calls.append(1) or {"ltd", "gmbh"}
+    assert ArtifactStore(store_path, [str(data_file)]).get("suffixes", build) == {"ltd", "gmbh"}
+    assert ArtifactStore(store_path, [str(data_file)]).get("suffixes", build) == {"ltd", "gmbh"}
+    assert len(calls) == 1
+
+def test_artifacts_rebuilt_when_data_changes(tmp_path, data_file):
+    store_path = str(tmp_path / "store.pkl")
+    ArtifactStore(store_path, [str(data_file)]).get("suffixes", lambda: "old")
+    data_file.write_text("ltd\ngmbh\nllc\n")
+    assert ArtifactStore(store_path, [str(data_file)]).get("suffixes", lambda: "new") == "new"
+
+def test_default_path_honours_env_override(tmp_path, monkeypatch, data_file):
+    monkeypatch.setenv("COLUMN_CLASSIFIER_CACHE_DIR", str(tmp_path / "cache"))
+    store = ArtifactStore(files=[str(data_file)])
+    assert store.path == str(tmp_path / "cache" / "reference_artifacts.pkl")
+
+def test_default_path_outside_package_data(monkeypatch):
+    monkeypatch.delenv("COLUMN_CLASSIFIER_CACHE_DIR", raising=False)
+    assert not ArtifactStore(files=[]).path.startswith(DATA_DIR)
@@ -0,0 +1,93 @@
+import argparse
+import json
+import pytest
+from project.utils.checkpoint import RunCheckpoint, input_fingerprint
+
+def test_checkpoint_round_trip_and_invalidation(tmp_path):
+    source = tmp_path / "input.csv"
+    source.write_text("id\n1\n")
+    output = tmp_path / "out.csv"
+    output.write_text("x" * 10)
+    settings = {"input": input_fingerprint(source), "chunksize": 100}
+    sidecar = tmp_path / "run.checkpoint.json"
+
+    checkpoint = RunCheckpoint(sidecar, settings)
+    assert checkpoint.load(output) is None
+    checkpoint.save(phone_col="phone", ranges=[(0, 5)], chunks=2, output_bytes=10)
+
+    state = RunCheckpoint(sidecar, settings).load(output)
+    assert state["chunks"] == 2 and state["phone_col"] == "phone" and state["ranges"] == [[0, 5]]
+    # Different settings or a changed input start over
+    assert RunCheckpoint(sidecar, dict(settings, chunksize=50)).load(output) is None
+    source.write_text("id\n1\n2\n")
+    assert RunCheckpoint(sidecar, {"input": input_fingerprint(source), "chunksize": 100}).load(output) is None
+    # The output must still hold everything the checkpoint recorded
+    output.write_text("x" * 5)
+    assert RunCheckpoint(sidecar, settings).load(output) is None
+
+    checkpoint.remove()
+    assert not sidecar.exists()
+    checkpoint.remove()
+
+def write_firms_csv(path, rows=400):
+    from project.utils.data_loader import get_company_df
+    names = get_company_df().iloc[:rows, 0].str.replace('"', '""')
+    lines = [f'"{name}",+1 475 216 {2000 + i}' for i, name in enumerate(names)]
+    path.write_text("company,phone\n" + "\n".join(lines) + "\n", encoding="utf-8")
+
+def run_parser(monkeypatch, argv):
+    import sys
+    from project import parser
+    monkeypatch.setattr(sys, "argv", ["parser.py"] + argv)
+    parser.main()
+
+@pytest.mark.parametrize("streaming", [["--chunksize", "50"], ["--split-input", "--range-size", "4000"]])
+@pytest.mark.parametrize("crash_after", [0, 3])
+def test_interrupted_run_resumes_to_same_output(tmp_path, monkeypatch, streaming, crash_after):
+    from project.utils.output_writer import ChunkWriter
+    source = tmp_path / "firms.csv"
+    write_firms_csv(source)
+    run_parser(monkeypatch, ["-i", str(source), "-o", str(tmp_path / "expected.csv")] + streaming)
+
+    output, sidecar = tmp_path / "out.csv", tmp_path / "run.checkpoint.json"
+    argv = ["-i", str(source), "-o", str(output), "--checkpoint", str(sidecar)] + streaming
+    write = ChunkWriter.write
+
+    def preempted_write(self, df):
+        if self.chunks == crash_after:
+            write(self, df.iloc[:len(df) // 2])  # a torn chunk, never recorded as complete
+            self._file.flush()
+            raise KeyboardInterrupt
+        write(self, df)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(ChunkWriter, "write", preempted_write)
+        with pytest.raises(KeyboardInterrupt):
+            run_parser(monkeypatch, argv)
+    saved = json.loads(sidecar.read_text())["state"]
+    assert saved["chunks"] == crash_after
+    assert ("ranges" in saved) == ("--split-input" in streaming)
+
+    run_parser(monkeypatch, argv)
+    assert output.read_text() == (tmp_path / "expected.csv").read_text()
+    assert not sidecar.exists()
+
+def test_resume_recomputes_missing_ranges(tmp_path, monkeypatch):
+    source = tmp_path / "firms.csv"
+    write_firms_csv(source)
+    streaming = ["--split-input", "--range-size", "4000"]
+    run_parser(monkeypatch, ["-i", str(source), "-o", str(tmp_path / "expected.csv")] + streaming)
+
+    # A checkpoint holding the column decision but no ranges, as written by a run stopped before the split
+    output, sidecar = tmp_path / "out.csv", tmp_path / "run.checkpoint.json"
+    argv = ["-i", str(source), "-o", str(output), "--checkpoint", str(sidecar)] + streaming
+    from project import parser
+    args = argparse.Namespace(input=str(source), output=str(output), output_format="csv", chunksize=None,
+                              split_input=True, range_size=4000, phone_region="US", phone_regions=None)
+    output.write_text("")
+    RunCheckpoint(sidecar, parser.checkpoint_settings(args)).save(
+        phone_col="phone", company_col="company", default_region="US", fallback_regions=[],
+        chunks=0, rows=0, output_bytes=0)
+
+    run_parser(monkeypatch, argv)
+    assert output.read_text() == (tmp_path / "expected.csv").read_text()
@@ -0,0 +1,58 @@
+import pandas as pd
+from project.utils.classification_cache import (
+    ClassificationCache, classify_with_cache, column_fingerprint, fingerprint_similarity, value_shapes,
+)
+
+PHONES_DAY1 = pd.Series([f"+1 (475) 216-{2000 + i}" for i in range(300)] + [None])
+PHONES_DAY2 = pd.Series([f"+1 (212) 555-{1000 + i}" for i in range(500)])
+FIRMS = pd.Series(["Acme Inc.", "Tresata pvt ltd.", "Foo GmbH & Co. KG"] * 20)
+
+def test_value_shapes():
+    assert value_shapes(pd.Series(["+1 (475) 216-2114", "Société Générale S.A."])).tolist() == ["+9 (9) 9-9", "a a a.a."]
+
+def test_fingerprints_match_across_days_of_a_feed():
+    day1, day2 = column_fingerprint("phone", PHONES_DAY1), column_fingerprint("phone", PHONES_DAY2)
+    assert fingerprint_similarity(day1, day2) == 1.0
+    assert fingerprint_similarity(day1, column_fingerprint("phone", FIRMS)) < 0.2
+    assert fingerprint_similarity(day1, column_fingerprint("tel", PHONES_DAY2)) == 0.0
+
+def test_cache_persists_and_is_tied_to_the_model(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = ClassificationCache(path, model="m1")
+    fingerprint = column_fingerprint("phone", PHONES_DAY1)
+    assert cache.lookup(fingerprint) is None
+    cache.store(fingerprint, "PhoneNumber", 0.97)
+    cache.save()
+
+    reloaded = ClassificationCache(path, model="m1")
+    hit = reloaded.lookup(column_fingerprint("phone", PHONES_DAY2))
+    assert hit == {"label": "PhoneNumber", "confidence": 0.97, "similarity": 1.0}
+    assert ClassificationCache(path, model="m2").lookup(fingerprint) is None
+
+def test_spot_check_rejects_stale_entries(tmp_path):
+    cache = ClassificationCache(tmp_path / "cache.json")
+    fingerprint = column_fingerprint("phone", PHONES_DAY1)
+    cache.store(fingerprint, "Other", 0.5)
+    assert cache.lookup(fingerprint, PHONES_DAY1, check=lambda sample: "PhoneNumber", spot_check_size=10) is None
+    assert cache.spot_check_failures == 1
+    assert len(cache) == 0
+
+def test_classify_with_cache_only_classifies_misses(tmp_path):
+    cache = ClassificationCache(tmp_path / "cache.json")
+    columns = [("phone", PHONES_DAY1), ("firm", FIRMS)]
+    labels = {"phone": "PhoneNumber", "firm": "CompanyName", "note": "Other"}
+    calls = []
+
+    def classifier_for(columns):
+        def classify(positions):
+            calls.append(positions)
+            return [{"label": labels[columns[i][0]], "confidence": 1.0, "seconds": 0.1} for i in positions]
+        return classify
+
+    first = classify_with_cache(cache, columns, classifier_for(columns))
+    columns = [("firm", FIRMS), ("phone", PHONES_DAY2), ("note", FIRMS)]
+    second = classify_with_cache(cache, columns, classifier_for(columns))
+    assert [r["label"] for r in first] == ["PhoneNumber", "CompanyName"]
+    assert calls == [[0, 1], [2]]
+    assert [r.get("cached", False) for r in second] == [True, True, False]
+    assert [r["label"] for r in second[:2]] == ["CompanyName", "PhoneNumber"]
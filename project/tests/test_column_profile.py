@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from project.utils.column_profile import ColumnProfile
+
+COLUMNS = {
+    "phone": pd.Series(["+1 475-216-2114", "(080) 1234 5678", "9876543210", None, "Not a phone"] * 20),
+    "company": pd.Series(["Tresata pvt ltd.", "Enno Roggemann GmbH & Co. KG", "First National Bank"] * 30),
+    "date": pd.Series(["2024-01-15", "15 Jan 2024", "n/a"] * 25),
+}
+
+@pytest.mark.parametrize("name", list(COLUMNS))
+def test_profile_classification_matches_column(classifier, name):
+    values = COLUMNS[name]
+    profile = classifier.profile_column(values, chunk_size=7)
+    assert classifier.classify_profile(profile) == pytest.approx(classifier.classify_column(values))
+    assert profile.count == len(values)
+    assert profile.missing == int(values.isna().sum())
+
+def test_merged_chunk_profiles_equal_whole_profile(classifier):
+    values = COLUMNS["phone"]
+    whole = classifier.profile_column(values)
+    parts = [classifier.profile_column(values.iloc[i:i + 30]) for i in range(0, len(values), 30)]
+    merged = ColumnProfile.merged(parts)
+    assert merged.count == whole.count
+    assert np.allclose(merged.sums, whole.sums)
+    assert np.array_equal(merged.length_histogram, whole.length_histogram)
+    assert np.array_equal(merged.registers, whole.registers)
+
+def test_distinct_estimate():
+    profile = ColumnProfile(["x"])
+    values = pd.Series([f"value-{i}" for i in range(20000)] * 2, dtype=object)
+    profile._add_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+    assert profile.distinct_estimate() == pytest.approx(20000, rel=0.05)
+    assert ColumnProfile(["x"]).distinct_estimate() == 0.0
+
+def test_merge_rejects_different_features():
+    with pytest.raises(ValueError):
+        ColumnProfile(["a"]).merge(ColumnProfile(["b"]))
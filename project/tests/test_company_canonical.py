@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+from project.utils.company_canonical import (
+    CompanyBlockIndex, CompanyCanonicalizer, canonical_suffix_map, canonical_suffix_tokens, name_tokens,
+)
+
+@pytest.fixture
+def canonicalizer(parser_utils):
+    return CompanyCanonicalizer(parser_utils)
+
+def test_suffix_variants_share_canonical_form(canonicalizer):
+    assert canonicalizer.canonicalize("ELATION CAPITAL LIMITED") == ("elation capital", "ltd")
+    assert canonicalizer.canonicalize("Elation Capital Ltd.") == ("elation capital", "ltd")
+    assert canonicalizer.canonicalize("Tresata Private Limited") == canonicalizer.canonicalize("Tresata pvt ltd.")
+    assert canonicalizer.canonicalize("Foo Public Limited Company") == ("foo", "plc")
+    assert canonicalizer.canonicalize("Enno Roggemann GmbH & Co. KG") == ("enno roggemann", "gmbhcokg")
+
+def test_name_tokens():
+    assert name_tokens("Tresata Pvt. Ltd.") == ["tresata", "pvt", "ltd"]
+    assert name_tokens("S. A.") == name_tokens("SA") == ["sa"]
+    assert name_tokens("Black & Decker and Co. a/s") == ["black", "decker", "co", "as"]
+    assert name_tokens("O'Neil, Inc.") == ["oneil", "inc"]
+
+def test_canonical_suffix_map_covers_legal_suffixes():
+    table = canonical_suffix_map()
+    assert table["limited"] == "ltd"
+    assert table["pty ltd"] == "ptyltd"
+    assert table["sp z oo"] == table["sp zoo"] == "spzoo"
+    assert canonical_suffix_tokens(["sociedad", "anonima"]) == "sa"
+
+def test_name_core_normalization(canonicalizer):
+    assert canonicalizer.canonicalize("The Société Générale S.A.") == ("societe generale", "sa")
+    # A bare legal form stays the core instead of leaving the name empty
+    assert canonicalizer.canonicalize("Limited") == ("limited", "")
+
+def test_blocking_keys(canonicalizer):
+    keys = canonicalizer.blocking_keys("Capital Elation Ltd")
+    assert keys == ["token:capital", "token:elation", "sorted:capital elation", "prefix:capi"]
+    assert "sorted:capital elation" in canonicalizer.blocking_keys("ELATION CAPITAL LIMITED")
+
+def test_canonicalize_names_column(canonicalizer):
+    values = pd.Series(["ELATION CAPITAL LIMITED", None, "Elation Capital Ltd."], index=[5, 6, 7])
+    df = canonicalizer.canonicalize_names(values)
+    assert list(df.index) == [5, 6, 7]
+    assert df.loc[5, "canonical_name"] == df.loc[7, "canonical_name"] == "elation capital ltd"
+    assert df.loc[6].tolist() == ["", "", "", "", ""]
+
+def test_block_index_groups_duplicates(canonicalizer):
+    names = pd.Series(["ELATION CAPITAL LIMITED", "Tresata pvt ltd.", "Elation Capital Ltd.",
+                       None, "Tresata Private Limited", "Other Holdings Inc"])
+    index = CompanyBlockIndex(canonicalizer)
+    index.add_many(names)
+    assert len(index) == 6
+    assert sorted(sorted(group) for group in index.groups()) == [[0, 2], [1, 4]]
+    assert index.candidate_pairs() == {(0, 2), (1, 4)}
+
+    single = CompanyBlockIndex(canonicalizer)
+    for record_id, name in names.items():
+        single.add(record_id, name)
+    assert sorted(sorted(group) for group in single.groups()) == [[0, 2], [1, 4]]
+
+def test_block_index_skips_oversized_blocks(canonicalizer):
+    names = pd.Series(["Alpha Capital", "Beta Capital", "Gamma Capital"])
+    index = CompanyBlockIndex(canonicalizer, key_types=("token",), max_block_size=2)
+    index.add_many(names, ids=["a", "b", "c"])
+    assert index.groups() == []
+    assert len(index.buckets["token:capital"]) == 3
+    with pytest.raises(ValueError):
+        CompanyBlockIndex(canonicalizer, key_types=("soundex",))
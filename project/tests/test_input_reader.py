@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+from project.utils.input_reader import csv_row_ranges, iter_table, read_columns, read_csv_range, read_table
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text('id,phone,note\n007,+1 475-216-2114,"multi\nline"\n2,NA,x\n3,(080) 1234 5678,\n')
+    return path
+
+def test_reads_every_column_as_text(csv_path):
+    df = read_table(csv_path)
+    assert df["id"].tolist() == ["007", "2", "3"]
+    assert df.equals(pd.read_csv(csv_path, dtype=str))
+
+def test_projection_and_nrows(csv_path):
+    df = read_table(csv_path, columns=["phone"], nrows=2)
+    assert list(df.columns) == ["phone"]
+    assert len(df) == 2
+    with pytest.raises(ValueError):
+        read_table(csv_path, columns=["missing"], engine="pyarrow")
+
+def test_pyarrow_engine_matches_pandas(csv_path):
+    pytest.importorskip("pyarrow")
+    pd.testing.assert_frame_equal(read_table(csv_path, engine="pyarrow"), read_table(csv_path))
+    chunks = list(iter_table(csv_path, chunksize=2, columns=["note", "id"], engine="pyarrow"))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), read_table(csv_path, columns=["id", "note"]))
+
+def test_parquet_input(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "input.parquet"
+    pd.DataFrame({"id": [1, 2], "firm": ["Acme Inc.", None]}).to_parquet(path)
+    assert read_columns(path) == ["id", "firm"]
+    df = read_table(path, columns=["id"])
+    assert df["id"].tolist() == ["1", "2"]
+
+def test_byte_ranges_never_split_quoted_fields(tmp_path):
+    path = tmp_path / "quoted.csv"
+    rows = [f'{i},"line one\nline ""two""\n",{i * 7}' for i in range(50)]
+    path.write_text('id,"note\nheader",n\n' + "\n".join(rows))
+    names = read_columns(path)
+    expected = pd.read_csv(path, dtype=str)
+    for range_size in (1, 13, 100, 10 ** 6):
+        ranges = csv_row_ranges(path, range_size)
+        assert ranges[-1][1] == path.stat().st_size
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        df = pd.concat([read_csv_range(path, start, end, names) for start, end in ranges], ignore_index=True)
+        pd.testing.assert_frame_equal(df, expected)
+    df = read_csv_range(path, *csv_row_ranges(path)[0], names, columns=["n"])
+    assert df["n"].tolist() == expected["n"].tolist()
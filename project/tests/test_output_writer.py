@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+from project.utils.output_writer import ChunkWriter
+
+CHUNKS = [
+    pd.DataFrame({"original_company_name": ["Acme Inc.", None], "parsed_legal_suffix": ["Inc.", ""]}),
+    pd.DataFrame({"original_company_name": ["Foo GmbH"], "parsed_legal_suffix": ["GmbH"]}),
+]
+
+def test_csv_chunks_match_single_write(tmp_path):
+    with ChunkWriter(tmp_path / "chunked.csv") as writer:
+        for chunk in CHUNKS:
+            writer.write(chunk)
+    pd.concat(CHUNKS).to_csv(tmp_path / "whole.csv", index=False)
+    assert (tmp_path / "chunked.csv").read_text() == (tmp_path / "whole.csv").read_text()
+    assert writer.rows == 3
+
+def test_csv_resume_drops_partial_chunk(tmp_path):
+    path = tmp_path / "out.csv"
+    with ChunkWriter(path) as writer:
+        writer.write(CHUNKS[0])
+        offset = writer.sync()
+        writer.write(CHUNKS[1])  # written, but not recorded as complete before a crash
+    with ChunkWriter(path, resume_offset=offset) as writer:
+        writer.write(CHUNKS[1])
+    pd.concat(CHUNKS).to_csv(tmp_path / "whole.csv", index=False)
+    assert path.read_text() == (tmp_path / "whole.csv").read_text()
+    with pytest.raises(ValueError):
+        ChunkWriter(tmp_path / "out.parquet", "parquet", resume_offset=0)
+
+@pytest.mark.parametrize("output_format", ["parquet", "arrow"])
+def test_columnar_chunks_are_dictionary_encoded(tmp_path, output_format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+    path = tmp_path / f"out.{output_format}"
+    with ChunkWriter(path, output_format) as writer:
+        for chunk in CHUNKS:
+            writer.write(chunk)
+    table = pa.parquet.read_table(path) if output_format == "parquet" else pa.ipc.open_file(path).read_all()
+    assert pa.types.is_dictionary(table.schema.field("parsed_legal_suffix").type)
+    assert table.column("parsed_legal_suffix").to_pylist() == ["Inc.", "", "GmbH"]
+    assert table.column("original_company_name").to_pylist() == ["Acme Inc.", None, "Foo GmbH"]
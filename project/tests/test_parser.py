@@ -1,13 +1,9 @@
 import pytest
 import pandas as pd
 from project.utils.parser_utils import ParserUtils
+from project.utils.parallel import ParallelParser
 import os
 
-@pytest.fixture
-def parser_utils():
-    # ParserUtils now loads global resources, so data_dir is not needed
-    return ParserUtils()
-
 def test_parse_phone_number_e164(parser_utils):
     # E.164 format with country code
     phone_str = "+14752162114"
@@ -58,4 +54,117 @@ def test_parse_company_name_empty_string(parser_utils):
     company_str = ""
     name, legal = parser_utils.parse_company_name(company_str)
     assert name == ""
-    assert legal == "" 
\ No newline at end of file
+    assert legal == "" 
+
+@pytest.mark.parametrize("company_str, expected", [
+    ("ARISTEIA CAPITAL, L.L.C.", ("ARISTEIA CAPITAL", "L.L.C")),
+    ("CAPITAL BANCORP PLC", ("CAPITAL BANCORP", "PLC")),
+    ("AUTO-MOTO RS, s. r.o.", ("AUTO-MOTO RS", "s. r.o")),
+    ("IPM Oak j.s.a.", ("IPM Oak j", "s.a")),
+    ("HOTEL VOJENS A/S", ("HOTEL VOJENS A/S", "")),
+])
+def test_parse_company_name_longest_suffix(parser_utils, company_str, expected):
+    assert parser_utils.parse_company_name(company_str) == expected
+
+def test_parse_company_name_matches_suffix_regex(parser_utils):
+    # Reference: the flexible per-suffix regex the trie replaced, anchored at the end of the name
+    from project.utils.data_loader import get_company_df, get_legal_suffixes_set
+    import re
+    cores = {"".join(filter(str.isalnum, s)) for s in get_legal_suffixes_set()} - {""}
+    patterns = sorted((r"\s*\.?\s*".join(core) for core in cores), key=len, reverse=True)
+    suffix_regex = re.compile(r"(?<!\w)(" + "|".join(patterns) + r")[\W_]*$", re.IGNORECASE)
+
+    def reference(company_str):
+        company_str = company_str.strip()
+        match = suffix_regex.search(company_str)
+        if not match:
+            return company_str, ""
+        return company_str[:match.start()].strip().rstrip('.,').strip(), match.group(1).strip()
+
+    names = get_company_df().iloc[:, 0].dropna().astype(str)
+    mismatches = [name for name in names if parser_utils.parse_company_name(name) != reference(name)]
+    assert mismatches == []
+
+def test_parallel_parser_preserves_order(parser_utils):
+    values = pd.Series(["Tresata pvt ltd.", "SOF LTD.", "First National Bank", "+14752162114", ""] * 3, index=range(100, 115))
+    with ParallelParser(workers=2, min_shard_size=2) as pool:
+        parsed = pool.map("parse_company_name", values)
+    pd.testing.assert_series_equal(parsed, values.apply(parser_utils.parse_company_name), check_dtype=False)
+
+def test_parallel_parser_parses_byte_ranges_in_order(parser_utils, tmp_path):
+    import functools
+    from project.parser import parse_columns
+    from project.utils.input_reader import csv_row_ranges, read_columns
+    path = tmp_path / "firms.csv"
+    rows = [f'{i},"Firm {i}\nHoldings Ltd.",+1 475 216 {2100 + i}' for i in range(40)]
+    path.write_text("id,firm,phone\n" + "\n".join(rows) + "\n")
+    ranges = csv_row_ranges(path, range_size=50)
+    assert len(ranges) > 5
+    build = functools.partial(parse_columns, phone_col="phone", company_col="firm")
+    with ParallelParser(workers=2) as pool:
+        parsed = pd.concat(pool.map_ranges(path, ranges, read_columns(path), ["firm", "phone"], build),
+                           ignore_index=True)
+    expected = parse_columns(pd.read_csv(path, dtype=str), "phone", "firm", parser_utils)
+    pd.testing.assert_frame_equal(parsed, expected)
+
+def test_map_unique_matches_apply_and_caches():
+    parser_utils = ParserUtils(cache_size=100)
+    values = pd.Series(["SOF LTD.", None, "SOF LTD.", float("nan"), "Tresata pvt ltd.", "SOF LTD."], dtype=object)
+    parsed = parser_utils.map_unique(values, "parse_company_name")
+    assert parsed.tolist() == [parser_utils.parse_company_name(value) for value in values]
+    parser_utils.map_unique(values, "parse_company_name")
+    cache = parser_utils.caches["parse_company_name"]
+    assert cache.hits == 4 and cache.misses == 4
+
+def test_map_unique_keeps_equal_values_of_different_types_apart():
+    parser_utils = ParserUtils(cache_size=100)
+    values = pd.Series([1, 1.0, True, "1", 1, None], dtype=object)
+    expected = [parser_utils.parse_company_name(value) for value in values]
+    assert [name for name, _ in expected] == ["1", "1.0", "True", "1", "1", "None"]
+    assert parser_utils.map_unique(values, "parse_company_name").tolist() == expected
+    # The cache keeps them apart too
+    reordered = values.iloc[::-1].reset_index(drop=True)
+    assert parser_utils.parse_company_names(reordered)["parsed_company_name"].tolist() == [name for name, _ in expected[::-1]]
+
+def test_phone_country_lookup_matches_geocoder(parser_utils):
+    import phonenumbers
+    from phonenumbers import geocoder
+    # +44 and +1 are shared by several regions; 800 numbers are valid in all NANP regions
+    for value in ["+14752162114", "+44 20 7946 0958", "+1 800 555 0199", "+91 8179275105", "+49 30 901820"]:
+        number = phonenumbers.parse(value, "US")
+        expected = geocoder.country_name_for_number(number, "en") if phonenumbers.is_valid_number(number) else ""
+        assert parser_utils.parse_phone_number(value)[0] == expected
+
+def test_phone_prefilter_rejects_non_numbers(parser_utils):
+    assert parser_utils.parse_phone_number("  Not a phone number ") == ("", "Not a phone number")
+    assert parser_utils.parse_phone_number("Q3") == ("", "Q3")
+
+def test_parse_phone_numbers_infers_dominant_region(parser_utils):
+    values = pd.Series(["080 1234 5678", "098765 43210", "022 2345 6789", "+1 475-216-2114", "Not a phone"])
+    assert parser_utils.infer_phone_region(values, ["US", "IN"]) == "IN"
+    parsed = parser_utils.parse_phone_numbers(values, regions=["US", "IN"])
+    assert list(parsed.columns) == ["parsed_country", "parsed_phone_number"]
+    assert list(parsed.itertuples(index=False, name=None)) == [
+        parser_utils.parse_phone_number(value, default_region="IN") for value in values
+    ]
+    with pytest.raises(ValueError):
+        parser_utils.parse_phone_numbers(values, regions=["US", "IN"], compute=lambda distinct: [])
+
+def test_batch_parsers_match_single_value_parsers():
+    parser_utils = ParserUtils(cache_size=100)
+    phones = pd.Series(["+14752162114", None, "(475) 216-2114", "+14752162114", "n/a", float("nan")], index=range(10, 16))
+    companies = pd.Series(["Tresata pvt ltd.", None, "SOF LTD.", "Tresata pvt ltd.", ""], index=list("abcde"))
+    parsed_phones = parser_utils.parse_phone_numbers(phones, infer_region=False)
+    parsed_companies = parser_utils.parse_company_names(companies)
+    assert list(parsed_phones.index) == list(phones.index)
+    assert list(parsed_phones.itertuples(index=False, name=None)) == [parser_utils.parse_phone_number(v) for v in phones]
+    assert list(parsed_companies.columns) == ["parsed_company_name", "parsed_legal_suffix"]
+    assert list(parsed_companies.itertuples(index=False, name=None)) == [parser_utils.parse_company_name(v) for v in companies]
+    # The batch parsers share the single-value methods' result caches
+    parser_utils.parse_company_names(companies)
+    assert parser_utils.caches["parse_company_name"].hits == 4
+
+def test_fallback_regions_retry_invalid_numbers():
+    parser_utils = ParserUtils(default_region="US", fallback_regions=["IN"])
+    assert parser_utils.parse_phone_number("080 1234 5678") == ("India", "8012345678")
+    assert parser_utils.parse_phone_number("(475) 216-2114") == ("United States", "4752162114")
@@ -1,15 +1,7 @@
 import pytest
 import pandas as pd
-from project.utils.classifier import FeatureExtractor, Classifier
-
-@pytest.fixture
-def feature_extractor():
-    # FeatureExtractor now loads global resources, so data_dir is not needed
-    return FeatureExtractor()
-
-@pytest.fixture
-def classifier(feature_extractor):
-    return Classifier(feature_extractor)
+from project.utils.classifier import Classifier
+from project.utils.parallel import ParallelClassifier
 
 def test_feature_extraction_phone_number(feature_extractor):
     data = pd.Series(["+1 475-216-2114", "(080) 1234 5678", "4853859590", "Not a phone"]) # Added a non-phone entry
@@ -66,4 +58,82 @@ def test_classifier_date(classifier):
 def test_classifier_other(classifier):
     data = pd.Series(["Random text", "Another random string", "Just some words"])
     label, confidence = classifier.classify_column(data)
-    assert label == "Other" 
\ No newline at end of file
+    assert label == "Other" 
+
+def test_extract_features_matches_per_value_path(feature_extractor):
+    data = pd.Series(["+1 475-216-2114", "Tresata pvt ltd.", "Enno Roggemann GmbH & Co. KG", "February 14, 2023",
+                      "  India  ", "", "²³ x", None, 3.5, "x.y-z/(1)+"])
+    expected = pd.DataFrame([feature_extractor._calculate_features_for_value(val) for val in data])
+    features_df = feature_extractor.extract_features(data)
+    pd.testing.assert_frame_equal(features_df, expected, check_dtype=False)
+
+def test_has_legal_suffix_agrees_with_parser(feature_extractor, parser_utils):
+    from project.utils.data_loader import get_company_df
+    names = pd.concat([get_company_df().iloc[:, 0].dropna().astype(str),
+                       pd.Series(["IPM Oak j.s.a.", "AUTO-MOTO RS, s. r.o.", "HOTEL VOJENS A/S", "Consult"])],
+                      ignore_index=True)
+    has_suffix = feature_extractor.extract_features(names)["has_legal_suffix"].astype(bool).tolist()
+    assert has_suffix == [parser_utils.parse_company_name(name)[1] != "" for name in names]
+
+def test_date_matchers_agree_with_individual_regexes(feature_extractor):
+    values = ["2023-01-15", "12/25/2024", "February 14, 2023", "Sun 21st Apr 2013", "Net Wednesday 6th Feb 2013",
+              "Tech March 28th, 2013", "Not a date", "+1 475-216-2114"]
+    for value in values:
+        expected = sum(1 for regex in feature_extractor.date_regexes if regex.search(value))
+        assert sum(matcher.count(value) for matcher in feature_extractor.date_matchers) == expected
+
+def test_classifier_sampled_stops_early(classifier):
+    data = pd.Series(["+1 475-216-2114", "(080) 1234 5678", "9876543210"] * 2000)
+    result = classifier.classify_column_sampled(data, max_sample_size=1000)
+    assert result["label"] == "PhoneNumber"
+    assert result["confidence"] > 0.8
+    assert result["sample_size"] <= 1000
+    assert result["column_size"] == 6000
+
+def test_parallel_classifier_matches_serial(classifier):
+    columns = [
+        pd.Series(["+1 475-216-2114", "(080) 1234 5678", "9876543210"]),
+        pd.Series(["Tresata pvt ltd.", "Enno Roggemann GmbH & Co. KG"]),
+        pd.Series(["Random text", "Another random string"]),
+    ]
+    with ParallelClassifier(workers=2) as pool:
+        results = pool.classify_columns(columns)
+    for column, result in zip(columns, results):
+        label, confidence = classifier.classify_column(column)
+        assert result["label"] == label
+        assert result["confidence"] == pytest.approx(confidence)
+
+def test_classify_files_batch(tmp_path, classifier):
+    from project.predict import classify_files, expand_inputs
+    for name in ("a.csv", "b.csv"):
+        pd.DataFrame({"firm": ["Tresata pvt ltd.", "Acme Inc."], "id": ["1", "2"]}).to_csv(tmp_path / name, index=False)
+    paths = expand_inputs([str(tmp_path / "*.csv"), str(tmp_path / "missing.csv")])
+    records = classify_files(classifier, paths, columns=["firm", "other"], nrows=1)
+    by_key = {(r["file"].rsplit("/", 1)[-1], r["column"]): r for r in records}
+    assert by_key[("a.csv", "firm")]["label"] == "CompanyName"
+    assert by_key[("b.csv", "firm")]["label"] == "CompanyName"
+    assert ("a.csv", "id") not in by_key
+    assert by_key[("a.csv", "other")]["error"] == "column not found"
+    assert by_key[("missing.csv", "")]["error"]
+
+def test_column_feature_matrix_aggregates_per_column(feature_extractor):
+    from project.utils.ml_backend import column_feature_matrix
+    columns = [pd.Series(["+1 475-216-2114", "Tresata pvt ltd."]), pd.Series([], dtype=object), pd.Series(["India"])]
+    X = column_feature_matrix(feature_extractor, columns)
+    assert X.dtype == "float32" and X.shape == (3, 26)
+    expected = feature_extractor.extract_features(columns[0]).astype(float)
+    assert X[0, :13] == pytest.approx(expected.mean().to_numpy())
+    assert X[0, 13:] == pytest.approx(expected.std(ddof=0).to_numpy(), abs=1e-6)
+    assert not X[1].any()
+
+def test_trained_model_classifies_held_out_columns(feature_extractor):
+    from project.utils.ml_backend import ColumnModel, column_feature_matrix, label_pools, split_pools, training_columns
+    train_pools, test_pools = split_pools(label_pools())
+    columns, labels = training_columns(train_pools, 15, max_size=60)
+    model = ColumnModel("logreg").fit(column_feature_matrix(feature_extractor, columns), labels)
+    trained = Classifier(feature_extractor, ml_model=model)
+    test_columns, test_labels = training_columns(test_pools, 5, max_size=60, random_state=1)
+    predictions = trained.classify_columns(test_columns)
+    accuracy = sum(label == expected for (label, _), expected in zip(predictions, test_labels)) / len(test_labels)
+    assert accuracy >= 0.9
+    assert trained.classify_column(test_columns[0]) == pytest.approx(predictions[0])
@@ -0,0 +1,24 @@
+import json
+from project.utils.profiling import StageProfiler
+
+def test_stages_accumulate_across_calls():
+    profiler = StageProfiler()
+    for _ in range(3):
+        with profiler.stage("parse_phone", rows=10):
+            sum(range(1000))
+    stage = profiler.report()["stages"]["parse_phone"]
+    assert stage["calls"] == 3
+    assert stage["rows"] == 30
+    assert stage["wall_s"] > 0
+    assert stage["rows_per_sec"] > 0
+
+def test_report_includes_columns_and_caches(tmp_path):
+    profiler = StageProfiler()
+    profiler.record_column("phone", 0.5, 1000, {"label": "PhoneNumber", "confidence": 0.9, "seconds": 0.5})
+    profiler.record_cache("parse_phone_number", hits=3, misses=1, size=1)
+    path = tmp_path / "profile.json"
+    profiler.write(str(path))
+    report = json.loads(path.read_text())
+    assert report["columns"] == [{"column": "phone", "seconds": 0.5, "rows": 1000, "rows_per_sec": 2000.0,
+                                  "label": "PhoneNumber", "confidence": 0.9}]
+    assert report["caches"]["parse_phone_number"]["hit_rate"] == 0.75
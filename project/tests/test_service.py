@@ -0,0 +1,64 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from project.utils.service import ClassificationService, RequestError, ServiceHTTPServer
+
+@pytest.fixture
+def service(classifier):
+    return ClassificationService(classifier)
+
+def test_classify_and_parse_columns(service):
+    response = service.classify({
+        "columns": {"company": ["Tresata pvt ltd.", "Enno Roggemann GmbH & Co. KG"], "noise": ["Random text"]},
+        "parse": True,
+    })
+    company = response["columns"]["company"]
+    assert company["label"] == "CompanyName"
+    assert company["parsed_company_name"] == ["Tresata pvt", "Enno Roggemann GmbH & Co"]
+    assert company["parsed_legal_suffix"] == ["ltd", "KG"]
+    assert "parsed_company_name" not in response["columns"]["noise"]
+
+def test_parse_rejects_unknown_type(service):
+    with pytest.raises(RequestError):
+        service.parse({"type": "Date", "values": ["2024-01-01"]})
+
+def test_parse_rejects_non_scalar_values(service):
+    with pytest.raises(RequestError):
+        service.parse({"type": "CompanyName", "values": ["Acme Inc.", ["nested"], {"a": 1}]})
+    with pytest.raises(RequestError):
+        service.classify({"columns": {"company": [{"a": 1}]}})
+
+def test_http_roundtrip(service):
+    server = ServiceHTTPServer(("127.0.0.1", 0), service, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/parse"
+        body = json.dumps({"type": "CompanyName", "values": ["Acme Inc."]}).encode()
+        with urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST")) as response:
+            assert json.loads(response.read()) == {"parsed_company_name": ["Acme"], "parsed_legal_suffix": ["Inc"]}
+        body = json.dumps({"type": "CompanyName", "values": [["Acme Inc."]]}).encode()
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST"))
+        assert error.value.code == 400
+        assert "values must be" in json.loads(error.value.read())["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_http_unexpected_error_answers_500(service, monkeypatch):
+    def broken(request):
+        raise KeyError("boom")
+    monkeypatch.setattr(service, "parse", broken)
+    server = ServiceHTTPServer(("127.0.0.1", 0), service, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/parse"
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(url, data=b'{"type": "CompanyName"}', method="POST"))
+        assert error.value.code == 500
+        assert "boom" in json.loads(error.value.read())["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Optional
+from project.utils.data_loader import DATA_DIR
+
+# Bump when the structure of any cached artifact changes; older stores are then rebuilt
+ARTIFACT_VERSION = 3
+REFERENCE_FILES = [os.path.join(DATA_DIR, "legal.txt"), os.path.join(DATA_DIR, "countries.txt")]
+# Directory override for the store; otherwise it lives in the user cache dir, never in the package tree
+ARTIFACT_DIR_ENV = "COLUMN_CLASSIFIER_CACHE_DIR"
+
+def default_artifact_path() -> str:
+    """Store path from $COLUMN_CLASSIFIER_CACHE_DIR, else $XDG_CACHE_HOME (or ~/.cache)/column_classifier."""
+    directory = os.environ.get(ARTIFACT_DIR_ENV)
+    if not directory:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(cache_home, "column_classifier")
+    return os.path.join(directory, "reference_artifacts.pkl")
+
+def reference_data_key(files=REFERENCE_FILES) -> str:
+    """Hash of the artifact version and the contents of the reference data files."""
+    digest = hashlib.sha256(f"v{ARTIFACT_VERSION}".encode())
+    for path in files:
+        digest.update(os.path.basename(path).encode())
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+class ArtifactStore:
+    """
+    On-disk store of structures derived from the reference data (suffix indexes, lookup sets, ...).
+
+    The store file records the key of the data it was built from; when legal.txt or countries.txt
+    change (or ARTIFACT_VERSION is bumped) the stale entries are discarded and rebuilt on demand.
+    Entries are built by the caller-supplied function on a miss and persisted with an atomic write.
+    """
+
+    def __init__(self, path: Optional[str] = None, files=REFERENCE_FILES):
+        self.path = path or default_artifact_path()
+        self.key = reference_data_key(files)
+        self.entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "rb") as f:
+                stored = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return {}
+        if not isinstance(stored, dict) or stored.get("key") != self.key:
+            return {}
+        return stored.get("entries", {})
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"key": self.key, "entries": self.entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # An unwritable cache dir still works, it just rebuilds the artifacts in every process
+            print(f"Warning: could not write artifact cache to {self.path}: {e}")
+
+    def get(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return the named artifact, building and persisting it if the store does not have it."""
+        if name not in self.entries:
+            self.entries[name] = build()
+            self._save()
+        return self.entries[name]
+
+_default_store: Optional[ArtifactStore] = None
+
+def get_artifact(name: str, build: Callable[[], Any]) -> Any:
+    """Look up `name` in the process-wide default store (opened on first use)."""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArtifactStore()
+    return _default_store.get(name, build)
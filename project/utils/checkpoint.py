@@ -0,0 +1,65 @@
+import json
+import os
+from typing import Optional
+
+CHECKPOINT_VERSION = 1
+
+def input_fingerprint(path) -> dict:
+    """Identity of an input file: a resumed run must read exactly the same bytes."""
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+class RunCheckpoint:
+    """
+    Sidecar JSON file that makes a streaming parser.py run resumable.
+
+    It holds the run's settings (input fingerprint, output path and format, chunking), the column
+    classification decision and the progress: the number of completed chunks (or byte ranges),
+    the rows written and the size of the output once they were written. Progress is saved after
+    the output is flushed to disk, and the sidecar is replaced atomically, so it never claims more
+    than the output holds. A restarted run truncates the output to the recorded size, dropping a
+    partially written chunk, and continues from the next chunk.
+    """
+
+    def __init__(self, path, settings: dict):
+        self.path = path
+        self.settings = dict(settings, version=CHECKPOINT_VERSION)
+        self.state = {}
+
+    def load(self, output_path) -> Optional[dict]:
+        """
+        The saved state if the sidecar exists and was written by a run with the same settings
+        whose output is still there, else None (the run then starts from the beginning).
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(saved, dict) or saved.get("settings") != self.settings:
+            return None
+        state = saved.get("state") or {}
+        try:
+            if os.path.getsize(output_path) < state.get("output_bytes", 0):
+                return None
+        except OSError:
+            return None
+        self.state = state
+        return state
+
+    def save(self, **progress):
+        """Merge `progress` into the state and write the sidecar atomically."""
+        self.state.update(progress)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"settings": self.settings, "state": self.state}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        """Delete the sidecar once the run is complete."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 1
+NUM_PERM = 64                # MinHash signature length: ~0.06 standard error on the similarity
+FINGERPRINT_SAMPLE = 2000    # Values (evenly spaced over the column) a fingerprint is computed from
+DEFAULT_TOLERANCE = 0.8      # Least fingerprint similarity at which a cached result is reused
+MAX_ENTRIES_PER_COLUMN = 8   # Fingerprints kept per (column name, dtype); the oldest are dropped
+_PRIME = (1 << 31) - 1
+_PERMUTATIONS = np.random.default_rng(20240501).integers(1, _PRIME, size=(2, NUM_PERM), dtype=np.uint64)
+
+def model_key(model_path) -> str:
+    """Hash of a saved model file: cached results are only reused for the model that produced them."""
+    if model_path is None or not os.path.exists(model_path):
+        return "builtin"
+    digest = hashlib.sha256()
+    with open(model_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+def sample_values(values: pd.Series, size: int) -> pd.Series:
+    """Up to `size` non-missing values, evenly spaced over the column (deterministic)."""
+    values = pd.Series(values, dtype=object).dropna()
+    if len(values) > size:
+        values = values.iloc[np.linspace(0, len(values) - 1, size).astype(np.int64)]
+    return values.reset_index(drop=True)
+
+def value_shapes(values: pd.Series) -> pd.Series:
+    """
+    Shape of every value: runs of letters become "a" and runs of digits "9", punctuation is kept
+    ("+1 (475) 216-2114" -> "+9 (9) 9-9"). Shapes stay the same from one day's file of a feed to the
+    next even when the values themselves do not.
+    """
+    # object dtype: Python's re, whose \w covers non-ASCII letters (the Arrow-backed str dtype's does not)
+    text = values.astype(str).astype(object)
+    return text.str.replace(r"[^\W\d_]+", "a", regex=True).str.replace(r"\d+", "9", regex=True)
+
+def column_fingerprint(name, values: pd.Series, sample_size: int = FINGERPRINT_SAMPLE) -> dict:
+    """
+    Cheap fingerprint of a column: its header name, its dtype and a MinHash signature of the set of
+    value shapes in an evenly spaced sample. Two columns' signatures agree in about the fraction of
+    positions that equals the Jaccard similarity of their shape sets.
+    """
+    values = pd.Series(values)
+    shapes = pd.unique(value_shapes(sample_values(values, sample_size)))
+    signature = np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    if len(shapes):
+        hashes = pd.util.hash_pandas_object(pd.Series(shapes, dtype=object), index=False).to_numpy(dtype=np.uint64)
+        hashes = hashes % np.uint64(_PRIME)
+        a, b = _PERMUTATIONS
+        signature = ((a[:, None] * hashes[None, :] + b[:, None]) % np.uint64(_PRIME)).min(axis=1)
+    return {"name": str(name), "dtype": str(values.dtype), "minhash": signature.tolist()}
+
+def fingerprint_similarity(first: dict, second: dict) -> float:
+    """Estimated Jaccard similarity of the value shapes; 0 unless the name and dtype are the same."""
+    if first["name"] != second["name"] or first["dtype"] != second["dtype"]:
+        return 0.0
+    return float(np.mean(np.asarray(first["minhash"]) == np.asarray(second["minhash"])))
+
+class ClassificationCache:
+    """
+    Persistent cache of column classifications, keyed by column fingerprints.
+
+    A column whose fingerprint matches a stored one (same name and dtype, signature similarity of
+    at least `tolerance`) gets the stored label and confidence without a feature pass. Entries
+    are tied to the model (`model_key`) that produced them. The cache is a JSON file, replaced
+    atomically by `save()`.
+    """
+
+    def __init__(self, path, model: str = "builtin", tolerance: float = DEFAULT_TOLERANCE):
+        self.path = path
+        self.model = model
+        self.tolerance = tolerance
+        self.entries = self._load()
+        self.hits = 0
+        self.misses = 0
+        self.spot_check_failures = 0
+        self._dirty = False
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(stored, dict) or stored.get("version") != CACHE_VERSION:
+            return {}
+        entries = {}
+        for entry in stored.get("entries", []):
+            entries.setdefault((entry["name"], entry["dtype"], entry["model"]), []).append(entry)
+        return entries
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.entries.values())
+
+    def lookup(self, fingerprint: dict, values: Optional[pd.Series] = None,
+               check: Optional[Callable[[pd.Series], str]] = None, spot_check_size: int = 0) -> Optional[dict]:
+        """
+        The cached result for a fingerprint, as {"label", "confidence", "similarity"}, or None.
+
+        With `spot_check_size` > 0, `check` classifies that many sampled `values` and the cached
+        result is only used when it gives the same label; otherwise the lookup counts as a miss.
+        """
+        key = (fingerprint["name"], fingerprint["dtype"], self.model)
+        best, best_similarity = None, -1.0
+        for entry in self.entries.get(key, []):
+            similarity = fingerprint_similarity(fingerprint, entry)
+            if similarity >= self.tolerance and similarity > best_similarity:
+                best, best_similarity = entry, similarity
+        if best is not None and spot_check_size and check is not None and values is not None:
+            if check(sample_values(values, spot_check_size)) != best["label"]:
+                # The feed changed under this fingerprint: drop the stale entry
+                self.spot_check_failures += 1
+                self.entries[key] = [entry for entry in self.entries[key] if entry is not best]
+                self._dirty = True
+                best = None
+        if best is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {"label": best["label"], "confidence": best["confidence"], "similarity": best_similarity}
+
+    def store(self, fingerprint: dict, label: str, confidence: float):
+        key = (fingerprint["name"], fingerprint["dtype"], self.model)
+        entries = [entry for entry in self.entries.get(key, []) if entry["minhash"] != fingerprint["minhash"]]
+        entries.append(dict(fingerprint, model=self.model, label=str(label), confidence=float(confidence)))
+        self.entries[key] = entries[-MAX_ENTRIES_PER_COLUMN:]
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": [entry for entries in self.entries.values() for entry in entries]}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+def classify_with_cache(cache: Optional[ClassificationCache], columns: Sequence[Tuple[str, pd.Series]],
+                        classify: Callable[[List[int]], List[dict]],
+                        check: Optional[Callable[[pd.Series], str]] = None, spot_check_size: int = 0) -> List[dict]:
+    """
+    Classify columns, reusing cached results where their fingerprints match.
+
+    Args:
+        cache (ClassificationCache, optional): Without a cache every column is classified.
+        columns (list): (name, values) per column.
+        classify (Callable): Takes the positions of the columns not found in the cache and returns
+            their results, dicts with `label` and `confidence` (or `error`), in the same order.
+        check, spot_check_size: Spot-check validation of cache hits, see ClassificationCache.lookup.
+
+    Returns:
+        list[dict]: One result per column, in order. Cached results have `cached` set, their
+            `similarity` and, as `seconds`, the time the fingerprint (and spot check) took.
+    """
+    if cache is None:
+        return classify(list(range(len(columns))))
+    results, fingerprints, missing = [None] * len(columns), [None] * len(columns), []
+    for i, (name, values) in enumerate(columns):
+        start = time.perf_counter()
+        fingerprints[i] = column_fingerprint(name, values)
+        hit = cache.lookup(fingerprints[i], values, check, spot_check_size)
+        if hit is None:
+            missing.append(i)
+        else:
+            results[i] = dict(hit, cached=True, seconds=time.perf_counter() - start)
+    for i, result in zip(missing, classify(missing) if missing else []):
+        results[i] = result
+        if "error" not in result:
+            cache.store(fingerprints[i], result["label"], result["confidence"])
+    return results
@@ -1,12 +1,20 @@
 import re
-import os
+import numpy as np
 import pandas as pd
-from utils.data_loader import GLOBAL_COUNTRIES_SET, GLOBAL_LEGAL_SUFFIXES_SET
+from typing import Optional
+from project.utils.data_loader import get_countries_set, get_legal_suffixes_set
+from project.utils.pattern_matcher import MultiPatternMatcher
+from project.utils.legal_suffix_index import find_legal_suffix, shared_suffix_index
+from project.utils.memo import factorize_values
+from project.utils.artifact_cache import get_artifact
+from project.utils.ml_backend import column_feature_matrix
+from project.utils.column_profile import ColumnProfile
 
 class FeatureExtractor:
     def __init__(self):
-        self.countries_set = GLOBAL_COUNTRIES_SET
-        self.legal_suffixes = GLOBAL_LEGAL_SUFFIXES_SET
+        # Reference sets and suffix structures come from the persistent artifact cache
+        self.countries_set = get_artifact("countries_set", get_countries_set)
+        self.legal_suffixes = get_artifact("legal_suffixes_set", get_legal_suffixes_set)
         
         # Regex patterns
         self.phone_regexes = [
@@ -35,15 +43,33 @@ class FeatureExtractor:
             "july", "august", "september", "october", "november", "december"
         ])
         
-        # Pre-process legal suffixes for efficient token-based lookup
-        self.normalized_legal_suffix_token_lists = []
-        for suffix in self.legal_suffixes:
-            # Normalize suffix: remove common punctuation and split into lowercase tokens
-            normalized_tokens = tuple(re.findall(r'\b\w+\b', suffix.lower()))
-            if normalized_tokens:
-                self.normalized_legal_suffix_token_lists.append(normalized_tokens)
-        # Sort by length descending for greedy matching of longer suffixes first
-        self.normalized_legal_suffix_token_lists.sort(key=len, reverse=True)
+        # The parser's legal suffix index: has_legal_suffix is set exactly when parse_company_name splits one off
+        self.legal_suffix_index = shared_suffix_index()
+
+        self._build_matchers()
+
+    def _build_matchers(self):
+        """
+        Combine the phone and date regexes into single-scan matchers with cheap prefilters.
+        Phone patterns only consist of digits, whitespace and `+().-`. Date patterns either only
+        consist of digits and `/.-`, or need both a digit and a month abbreviation.
+        """
+        self.phone_matcher = MultiPatternMatcher(self.phone_regexes, prefilter=re.compile(r"^[\d\s+().-]+$"))
+        month_abbrev = re.compile(r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec", re.IGNORECASE)
+        self.date_matchers = [
+            MultiPatternMatcher([regex for regex in self.date_regexes if not month_abbrev.search(regex.pattern)],
+                                prefilter=re.compile(r"^[\d/.-]+$")),
+            MultiPatternMatcher([regex for regex in self.date_regexes if month_abbrev.search(regex.pattern)],
+                                prefilter=re.compile(r"^(?=.*?\d).*?(?:" + month_abbrev.pattern + ")", re.IGNORECASE | re.DOTALL)),
+        ]
+
+    def __setstate__(self, state):
+        # Classifiers pickled before the matchers existed still load
+        self.__dict__.update(state)
+        if "phone_matcher" not in state or "date_matchers" not in state:
+            self._build_matchers()
+        # Older pickles hold a token-keyed suffix index (or none); always use the shared one
+        self.legal_suffix_index = shared_suffix_index()
 
     def _load_countries(self, filepath):
         # This method is no longer needed as countries are loaded globally
@@ -75,18 +101,12 @@ class FeatureExtractor:
         # Dictionary checks
         features['is_country'] = 1 if any(token in self.countries_set for token in tokens) else 0 # More flexible country check
         
-        # Improved legal suffix check: token-based matching
-        features['has_legal_suffix'] = 0
-        if tokens: # Only proceed if there are tokens to check
-            for suffix_tokens in self.normalized_legal_suffix_token_lists:
-                # Check if the sequence of suffix_tokens appears at the end of the value's tokens
-                if len(tokens) >= len(suffix_tokens) and tokens[len(tokens) - len(suffix_tokens):] == list(suffix_tokens):
-                    features['has_legal_suffix'] = 1
-                    break
+        # Improved legal suffix check: the same lookup parse_company_name splits the suffix off with
+        features['has_legal_suffix'] = 1 if find_legal_suffix(self.legal_suffix_index, value) else 0
 
         # Regex checks
-        features['regex_phone_matches_count'] = sum(1 for regex in self.phone_regexes if regex.search(value))
-        features['regex_date_matches_count'] = sum(1 for regex in self.date_regexes if regex.search(value))
+        features['regex_phone_matches_count'] = self.phone_matcher.count(value)
+        features['regex_date_matches_count'] = sum(matcher.count(value) for matcher in self.date_matchers)
         features['contains_month_names'] = 1 if any(month in value.lower() for month in self.month_names) else 0
         
         return features
@@ -100,42 +120,91 @@ class FeatureExtractor:
 
         Returns:
             pd.DataFrame: A DataFrame where each row is a feature vector for a value.
+
+        Features only depend on the value, so they are computed once per distinct value and
+        broadcast back; that is where the speedup over the per-row loop comes from. There is no
+        column-at-a-time (.str) engine: on object columns the .str methods are Python loops too,
+        and on the distinct values of the benchmark pools they ran at 0.1x (10 values) to 1.2x
+        (100k values) the speed of the per-value loop, so no distinct-count threshold pays off.
         """
-        feature_list = [self._calculate_features_for_value(val) for val in column_values]
-        return pd.DataFrame(feature_list)
+        codes, uniques = factorize_values(pd.Series(column_values, dtype=object))
+        if not uniques:
+            return pd.DataFrame(columns=list(self._calculate_features_for_value("")))
+        unique_features = pd.DataFrame([self._calculate_features_for_value(val) for val in uniques])
+        return unique_features.take(codes).reset_index(drop=True)
 
 class Classifier:
-    def __init__(self, feature_extractor: FeatureExtractor):
+    def __init__(self, feature_extractor: FeatureExtractor, ml_model=None):
         self.feature_extractor = feature_extractor
-        # Placeholder for ML model (will be trained later)
-        self.ml_model = None 
+        # Trained column model (ml_backend.ColumnModel); the heuristic scores are used without one
+        self.ml_model = ml_model
+
+    def classify_columns(self, columns: list) -> list:
+        """
+        Classifies a batch of columns; with a trained `ml_model` this is one feature pass and one
+        vectorized `predict_proba` call for the whole batch.
 
-    def classify_column(self, column_values: pd.Series) -> tuple[str, float]:
+        Returns:
+            list[tuple[str, float]]: (label, confidence) per column, in input order.
+        """
+        if self.ml_model is None:
+            return [self.classify_column(pd.Series(column, dtype=object)) for column in columns]
+        return self.ml_model.predict(column_feature_matrix(self.feature_extractor, columns))
+
+    def classify_column(self, column_values: pd.Series, max_sample_size: Optional[int] = None) -> tuple[str, float]:
         """
         Classifies a column based on its values and returns a semantic label and confidence.
         
         Args:
             column_values (pd.Series): The values of the column to classify.
+            max_sample_size (int, optional): If given, classify on an adaptively grown random sample
+                of at most this many values instead of the full column (see `classify_column_sampled`).
 
         Returns:
             tuple[str, float]: A tuple containing the predicted label and a confidence score (0-1).
         """
+        if max_sample_size is not None:
+            result = self.classify_column_sampled(column_values, max_sample_size=max_sample_size)
+            return result["label"], result["confidence"]
+        if self.ml_model is not None:
+            return self.classify_columns([column_values])[0]
+
         features_df = self.feature_extractor.extract_features(column_values)
-        
+        return self._pick_label(self._column_scores(features_df.mean()))
+
+    def classify_profile(self, profile: ColumnProfile) -> tuple[str, float]:
+        """
+        Classifies a column from its ColumnProfile (e.g. accumulated chunk by chunk, or merged from
+        several workers) instead of its values. Gives the same result as classify_column on the
+        values the profile was built from.
+        """
+        if self.ml_model is not None:
+            return self.ml_model.predict(profile.feature_vector()[None, :])[0]
+        return self._pick_label(self._column_scores(profile.means()))
+
+    def profile_column(self, column_values: pd.Series, chunk_size: int = 100000) -> ColumnProfile:
+        """ColumnProfile of a column, built `chunk_size` values at a time."""
+        return ColumnProfile.from_values(column_values, self.feature_extractor, chunk_size)
+
+    @staticmethod
+    def _column_scores(feature_means: pd.Series) -> dict:
+        """Heuristic label scores from the column means of the features."""
         # Heuristic-based classification
-        phone_score = features_df['regex_phone_matches_count'].mean()
+        phone_score = feature_means['regex_phone_matches_count']
         # Modified date_score calculation to give more weight to pure regex matches
-        date_score = features_df['regex_date_matches_count'].mean() * 0.8 + features_df['contains_month_names'].mean() * 0.2
-        country_score = features_df['is_country'].mean()
-        company_score = features_df['has_legal_suffix'].mean()
-        
-        scores = {
+        date_score = feature_means['regex_date_matches_count'] * 0.8 + feature_means['contains_month_names'] * 0.2
+        country_score = feature_means['is_country']
+        company_score = feature_means['has_legal_suffix']
+
+        return {
             "PhoneNumber": phone_score,
             "Date": date_score,
             "Country": country_score,
             "CompanyName": company_score,
         }
-        
+
+    @staticmethod
+    def _pick_label(scores: dict) -> tuple[str, float]:
         # Find the label with the maximum score
         best_label = "Other"
         max_score = 0.0
@@ -149,4 +218,76 @@ class Classifier:
         if max_score == 0.0: # If no specific feature was detected at all
             return "Other", 0.5 # Default confidence when no specific feature matches
             
-        return best_label, max_score 
\ No newline at end of file
+        return best_label, max_score
+
+    @staticmethod
+    def _row_scores(features_df: pd.DataFrame) -> pd.DataFrame:
+        """Per-value contribution to each label score; the column scores are their means."""
+        return pd.DataFrame({
+            "PhoneNumber": features_df['regex_phone_matches_count'],
+            "Date": features_df['regex_date_matches_count'] * 0.8 + features_df['contains_month_names'] * 0.2,
+            "Country": features_df['is_country'],
+            "CompanyName": features_df['has_legal_suffix'],
+        })
+
+    def classify_column_sampled(self, column_values: pd.Series, max_sample_size: int = 10000,
+                                initial_sample_size: int = 200, ci_half_width: float = 0.05,
+                                min_margin: float = 0.25, z: float = 1.96, random_state: int = 0) -> dict:
+        """
+        Classifies a column from a random sample that doubles in size until the estimate is stable.
+
+        Sampling stops as soon as the confidence interval of the leading label's score is narrower
+        than `ci_half_width`, the lead over the runner-up is decisive (the lower bound of the score
+        difference exceeds `min_margin`), the sample reaches `max_sample_size`, or the column is
+        exhausted. Features are only extracted for the values added in each round.
+
+        Args:
+            column_values (pd.Series): The values of the column to classify.
+            max_sample_size (int): Upper bound on the number of values examined.
+            initial_sample_size (int): Size of the first sample.
+            ci_half_width (float): Target half-width of the leading score's confidence interval.
+            min_margin (float): Score lead over the runner-up that is considered decisive.
+            z (float): Normal quantile used for the confidence intervals (1.96 ~ 95%).
+            random_state (int): Seed for the sampling order, so results are reproducible.
+
+        Returns:
+            dict: `label`, `confidence`, `sample_size`, `column_size` and `ci_half_width`
+                (half-width of the interval around `confidence`). With a trained `ml_model`, the
+                model classifies one random sample of `max_sample_size` values and `ci_half_width` is None.
+        """
+        n = len(column_values)
+        order = np.random.default_rng(random_state).permutation(n)
+        limit = min(n, max_sample_size)
+        if self.ml_model is not None:
+            label, confidence = self.classify_columns([column_values.iloc[order[:limit]]])[0]
+            return {"label": label, "confidence": confidence, "sample_size": limit, "column_size": n,
+                    "ci_half_width": None}
+        size = min(initial_sample_size, limit)
+        row_scores = []
+        taken = 0
+        while True:
+            batch = column_values.iloc[order[taken:size]]
+            row_scores.append(self._row_scores(self.feature_extractor.extract_features(batch)))
+            taken = size
+            sample_scores = pd.concat(row_scores, ignore_index=True)
+            label, confidence = self._pick_label(sample_scores.mean().to_dict())
+
+            # Finite population correction: the interval shrinks to zero once the whole column is seen
+            fpc = np.sqrt((n - taken) / (n - 1)) if n > 1 else 0.0
+            half_width = 0.0
+            decisive = False
+            if label in sample_scores and taken > 1:
+                half_width = z * sample_scores[label].std() / np.sqrt(taken) * fpc
+                runner_up = sample_scores.mean().drop(label).idxmax()
+                diff = sample_scores[label] - sample_scores[runner_up]
+                decisive = diff.mean() - z * diff.std() / np.sqrt(taken) * fpc > min_margin
+
+            if taken >= limit or half_width <= ci_half_width or decisive:
+                return {
+                    "label": label,
+                    "confidence": confidence,
+                    "sample_size": taken,
+                    "column_size": n,
+                    "ci_half_width": float(half_width),
+                }
+            size = min(taken * 2, limit)
@@ -0,0 +1,287 @@
+import functools
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from project.utils.data_loader import get_legal_suffixes_set
+from project.utils.memo import factorize_values, map_unique
+from project.utils.parser_utils import ParserUtils
+
+# Spelled-out legal forms and their abbreviation, on normalized tokens (see name_tokens)
+SUFFIX_ALIASES = {
+    ("public", "limited", "company"): ("plc",),
+    ("public", "company", "limited"): ("pcl",),
+    ("limited", "liability", "company"): ("llc",),
+    ("limited", "liability", "partnership"): ("llp",),
+    ("public", "joint", "stock", "company"): ("pjsc",),
+    ("joint", "stock", "company"): ("jsc",),
+    ("gesellschaft", "mit", "beschrankter", "haftung"): ("gmbh",),
+    ("aktiengesellschaft",): ("ag",),
+    ("actien", "gesellschaft"): ("ag",),
+    ("societe", "anonyme"): ("sa",),
+    ("sociedad", "anonima"): ("sa",),
+    ("societa", "per", "azioni"): ("spa",),
+    ("besloten", "vennootschap"): ("bv",),
+    ("naamloze", "vennootschap"): ("nv",),
+    ("kabushiki", "kaisha"): ("kk",),
+}
+# Single-token long forms, applied to the tokens no alias above covers
+SUFFIX_TOKEN_ALIASES = {
+    "limited": "ltd", "incorporated": "inc", "corporation": "corp", "company": "co",
+    "private": "pvt", "proprietary": "pty", "spolka": "sp",
+}
+# Tokens that never tell two company names apart
+NAME_STOPWORDS = frozenset({"the"})
+BLOCKING_KEY_TYPES = ("token", "sorted", "prefix")
+DEFAULT_PREFIX_LENGTH = 4
+
+def _token_parts(token: str) -> List[str]:
+    # Lowercase; dots and apostrophes vanish, '&'/'and' and any other punctuation separate parts
+    text = re.sub(r"\band\b", " ", token.lower()).replace(".", "").replace("'", "")
+    return re.sub(r"[^a-z0-9]+", " ", text).split()
+
+def name_tokens(text: str) -> List[str]:
+    """
+    Normalized tokens of a company name or legal suffix, as the canonical forms compare them:
+    lowercase ASCII letters and digits, '&'/'and' dropped as connectors, and runs of single
+    letters merged, so "S. A." and "SA" are both ["sa"].
+    """
+    tokens, in_letter_run = [], False
+    for token in text.split():
+        for part in _token_parts(token):
+            if len(part) == 1 and part.isalpha() and in_letter_run:
+                tokens[-1] += part
+            else:
+                tokens.append(part)
+                in_letter_run = len(part) == 1 and part.isalpha()
+    return tokens
+
+def canonical_suffix_tokens(tokens: Sequence[str]) -> str:
+    """
+    Canonical form of a normalized legal suffix: spelled-out forms are replaced by their
+    abbreviation (longest alias first, left to right) and the tokens are joined without spaces,
+    so "Pvt. Ltd.", "Private Limited" and "pvt ltd" all become "pvtltd".
+    """
+    max_alias = max(len(alias) for alias in SUFFIX_ALIASES)
+    out, i = [], 0
+    while i < len(tokens):
+        for k in range(min(max_alias, len(tokens) - i), 0, -1):
+            alias = SUFFIX_ALIASES.get(tuple(tokens[i:i + k]))
+            if alias is not None:
+                out.extend(alias)
+                i += k
+                break
+        else:
+            out.append(SUFFIX_TOKEN_ALIASES.get(tokens[i], tokens[i]))
+            i += 1
+    return "".join(out)
+
+@functools.lru_cache(maxsize=None)
+def canonical_suffix_map() -> Dict[str, str]:
+    """Canonical form of every suffix in legal.txt, keyed by its normalized tokens joined with spaces."""
+    table = {}
+    for suffix in get_legal_suffixes_set():
+        if suffix.startswith("#"):
+            continue
+        tokens = name_tokens(suffix)
+        if tokens:
+            table[" ".join(tokens)] = canonical_suffix_tokens(tokens)
+    return table
+
+def _fold_accents(text: str) -> str:
+    # "Société" -> "Societe": the token normalization only keeps ASCII letters and digits
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+class CompanyCanonicalizer:
+    """
+    Canonical forms and blocking keys of company names, for grouping duplicates.
+
+    A name is split into its core and legal suffix by `ParserUtils.parse_company_name`. The core is
+    normalized by `name_tokens` (lowercase, no punctuation, '&'/'and' dropped, "S. A." -> "sa")
+    with stop words removed; the suffix is mapped to its canonical form.
+    "ELATION CAPITAL LIMITED" and "Elation Capital Ltd." both become ("elation capital", "ltd").
+    """
+
+    def __init__(self, parser_utils: Optional[ParserUtils] = None, prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        self.parser_utils = parser_utils or ParserUtils()
+        self.prefix_length = prefix_length
+        self.suffix_map = canonical_suffix_map()
+
+    def core_tokens(self, name: str) -> List[str]:
+        """Normalized tokens of a name core (a name without its legal suffix)."""
+        return [token for token in name_tokens(_fold_accents(name)) if token not in NAME_STOPWORDS]
+
+    def canonical_suffix(self, legal: str) -> str:
+        """Canonical form of a legal suffix as split off by parse_company_name ("" if there is none)."""
+        tokens = name_tokens(_fold_accents(legal))
+        joined = " ".join(tokens)
+        if joined in self.suffix_map:
+            return self.suffix_map[joined]
+        return canonical_suffix_tokens(tokens)
+
+    def canonicalize(self, name_str: str) -> Tuple[str, str]:
+        """
+        (normalized name core, canonical legal suffix) of a company name. parse_company_name splits
+        off one suffix; legal forms left at the end of the core ("Tresata pvt" + "ltd.") are moved
+        to the suffix too, longest first, as long as a core token remains.
+        """
+        name, legal = self.parser_utils.parse_company_name(name_str)
+        core_tokens = self.core_tokens(name)
+        suffix_tokens = name_tokens(_fold_accents(legal))
+        while len(core_tokens) > 1:
+            for k in range(len(core_tokens) - 1, 0, -1):
+                if " ".join(core_tokens[-k:]) in self.suffix_map:
+                    suffix_tokens = core_tokens[-k:] + suffix_tokens
+                    core_tokens = core_tokens[:-k]
+                    break
+            else:
+                break
+        core = " ".join(core_tokens)
+        suffix = self.canonical_suffix(" ".join(suffix_tokens)) if suffix_tokens else ""
+        if not core:
+            # Nothing but a legal form (e.g. "Limited"): keep it as the core
+            core, suffix = " ".join(self.core_tokens(str(name_str))), ""
+        return core, suffix
+
+    def blocking_keys(self, name_str: str) -> List[str]:
+        """
+        Blocking keys of a company name, tagged with their type:
+        "token:<t>" per distinct core token, "sorted:<tokens in sorted order>" and
+        "prefix:<first prefix_length characters of the core without spaces>".
+        """
+        core, _ = self.canonicalize(name_str)
+        return self._keys(core.split())
+
+    def _keys(self, tokens: List[str]) -> List[str]:
+        if not tokens:
+            return []
+        distinct = sorted(set(tokens))
+        keys = [f"token:{token}" for token in distinct]
+        keys.append("sorted:" + " ".join(distinct))
+        keys.append("prefix:" + "".join(tokens)[:self.prefix_length])
+        return keys
+
+    def canonicalize_names(self, values: pd.Series) -> pd.DataFrame:
+        """
+        Canonical forms of a column of company names, computed once per distinct name.
+
+        Returns:
+            pd.DataFrame: name_core, canonical_suffix, canonical_name ("<core> <suffix>"),
+            sorted_key and prefix_key, aligned with `values.index`. Missing names give empty strings.
+        """
+        def compute(distinct):
+            rows = []
+            for value in distinct:
+                if not isinstance(value, str):
+                    rows.append(("", "", "", "", ""))
+                    continue
+                core, suffix = self.canonicalize(value)
+                tokens = core.split()
+                rows.append((core, suffix, f"{core} {suffix}".strip(),
+                             " ".join(sorted(set(tokens))), "".join(tokens)[:self.prefix_length]))
+            return rows
+
+        results = map_unique(values, compute)
+        columns = ["name_core", "canonical_suffix", "canonical_name", "sorted_key", "prefix_key"]
+        return pd.DataFrame(results.tolist(), columns=columns, index=values.index)
+
+class CompanyBlockIndex:
+    """
+    Hash index from blocking keys to the records that share them.
+
+    Every record lands in a handful of buckets (one per key), so candidate duplicates are found by
+    hashing in time linear in the number of records instead of by comparing all pairs. Buckets
+    larger than `max_block_size` (very common tokens or prefixes) carry little signal and would
+    bring the quadratic cost back; they are skipped when candidates are produced.
+
+    Args:
+        canonicalizer (CompanyCanonicalizer, optional): Produces the keys; a default one is built if omitted.
+        key_types (tuple): Blocking keys used, among BLOCKING_KEY_TYPES. The default "sorted" groups
+            names whose cores have the same tokens in any order; add "prefix" or "token" for looser recall.
+        max_block_size (int): Largest bucket whose records are paired.
+    """
+
+    def __init__(self, canonicalizer: Optional[CompanyCanonicalizer] = None, key_types: Sequence[str] = ("sorted",),
+                 max_block_size: int = 1000):
+        unknown = [key_type for key_type in key_types if key_type not in BLOCKING_KEY_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown blocking key types {unknown}; expected any of {', '.join(BLOCKING_KEY_TYPES)}.")
+        self.canonicalizer = canonicalizer or CompanyCanonicalizer()
+        self.key_types = tuple(key_types)
+        self.max_block_size = max_block_size
+        self.buckets: Dict[str, List[Hashable]] = defaultdict(list)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _selected_keys(self, name_str) -> List[str]:
+        if not isinstance(name_str, str):
+            return []
+        return [key for key in self.canonicalizer.blocking_keys(name_str) if key.split(":", 1)[0] in self.key_types]
+
+    def add(self, record_id: Hashable, name_str: str):
+        for key in self._selected_keys(name_str):
+            self.buckets[key].append(record_id)
+        self.size += 1
+
+    def add_many(self, names: pd.Series, ids: Optional[Iterable[Hashable]] = None):
+        """Index a column of names (ids default to its index); keys are computed once per distinct name."""
+        names = pd.Series(names, dtype=object)
+        ids = np.asarray(list(names.index) if ids is None else list(ids), dtype=object)
+        codes, uniques = factorize_values(names)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        for i, value in enumerate(uniques):
+            keys = self._selected_keys(value)
+            if keys:
+                members = ids[order[bounds[i]:bounds[i + 1]]].tolist()
+                for key in keys:
+                    self.buckets[key].extend(members)
+        self.size += len(names)
+
+    def blocks(self) -> Iterable[Tuple[str, List[Hashable]]]:
+        """(key, record ids) of every bucket holding between 2 and max_block_size records."""
+        for key, members in self.buckets.items():
+            if 1 < len(members) <= self.max_block_size:
+                yield key, members
+
+    def candidate_pairs(self) -> set:
+        """Distinct pairs of records that share at least one usable bucket, each as (first added, later added)."""
+        pairs = set()
+        for _, members in self.blocks():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    if members[i] != members[j]:
+                        pairs.add((members[i], members[j]))
+        return pairs
+
+    def groups(self) -> List[List[Hashable]]:
+        """
+        Candidate duplicate groups: records connected through shared buckets (union-find over the
+        buckets, near-linear in the number of records). Only groups of two or more are returned.
+        """
+        parent = {}
+
+        def find(x):
+            root = x
+            while parent.setdefault(root, root) != root:
+                root = parent[root]
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        for _, members in self.blocks():
+            first = find(members[0])
+            for other in members[1:]:
+                root = find(other)
+                if root != first:
+                    parent[root] = first
+        components = defaultdict(list)
+        for record in parent:
+            components[find(record)].append(record)
+        return [members for members in components.values() if len(members) > 1]
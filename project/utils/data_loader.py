@@ -1,12 +1,13 @@
 import pandas as pd
 import os
+import functools
 
-# Define the base data directory
-DATA_DIR = "project/data"
+# Define the base data directory (next to this package, independent of the working directory)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 
-def load_countries(filepath=os.path.join(DATA_DIR, "Countries.txt")) -> set:
+def load_countries(filepath=os.path.join(DATA_DIR, "countries.txt")) -> set:
     """
-    Loads country names from Countries.txt into a set.
+    Loads country names from countries.txt into a set.
     """
     if not os.path.exists(filepath):
         print(f"Warning: Countries file not found at {filepath}")
@@ -37,9 +38,9 @@ def load_company_data(filepath=os.path.join(DATA_DIR, "Company.csv")) -> pd.Data
         print(f"Error loading Company.csv: {e}")
         return pd.DataFrame()
 
-def load_date_data(filepath=os.path.join(DATA_DIR, "Dates.csv")) -> pd.DataFrame:
+def load_date_data(filepath=os.path.join(DATA_DIR, "dates.csv")) -> pd.DataFrame:
     """
-    Loads date examples from Dates.csv into a Pandas DataFrame.
+    Loads date examples from dates.csv into a Pandas DataFrame.
     """
     if not os.path.exists(filepath):
         print(f"Warning: Dates data file not found at {filepath}")
@@ -47,7 +48,7 @@ def load_date_data(filepath=os.path.join(DATA_DIR, "Dates.csv")) -> pd.DataFrame
     try:
         return pd.read_csv(filepath)
     except Exception as e:
-        print(f"Error loading Dates.csv: {e}")
+        print(f"Error loading dates.csv: {e}")
         return pd.DataFrame()
 
 def load_phone_number_data(filepath=os.path.join(DATA_DIR, "phoneNumber.csv")) -> pd.DataFrame:
@@ -63,9 +64,37 @@ def load_phone_number_data(filepath=os.path.join(DATA_DIR, "phoneNumber.csv")) -
         print(f"Error loading phoneNumber.csv: {e}")
         return pd.DataFrame()
 
-# Global resources
-GLOBAL_COUNTRIES_SET = load_countries()
-GLOBAL_LEGAL_SUFFIXES_SET = load_legal_suffixes()
-GLOBAL_COMPANY_DF = load_company_data()
-GLOBAL_DATES_DF = load_date_data()
-GLOBAL_PHONE_NUMBERS_DF = load_phone_number_data() 
\ No newline at end of file
+# Global resources, loaded on first use and memoized for the life of the process
+@functools.lru_cache(maxsize=None)
+def get_countries_set() -> set:
+    return load_countries()
+
+@functools.lru_cache(maxsize=None)
+def get_legal_suffixes_set() -> set:
+    return load_legal_suffixes()
+
+@functools.lru_cache(maxsize=None)
+def get_company_df() -> pd.DataFrame:
+    return load_company_data()
+
+@functools.lru_cache(maxsize=None)
+def get_dates_df() -> pd.DataFrame:
+    return load_date_data()
+
+@functools.lru_cache(maxsize=None)
+def get_phone_numbers_df() -> pd.DataFrame:
+    return load_phone_number_data()
+
+_LAZY_GLOBALS = {
+    "GLOBAL_COUNTRIES_SET": get_countries_set,
+    "GLOBAL_LEGAL_SUFFIXES_SET": get_legal_suffixes_set,
+    "GLOBAL_COMPANY_DF": get_company_df,
+    "GLOBAL_DATES_DF": get_dates_df,
+    "GLOBAL_PHONE_NUMBERS_DF": get_phone_numbers_df,
+}
+
+def __getattr__(name):
+    # Keeps `from project.utils.data_loader import GLOBAL_...` working without loading at import time
+    if name in _LAZY_GLOBALS:
+        return _LAZY_GLOBALS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,10 @@
 from project.utils.parser_utils import ParserUtils
+from project.utils.legal_suffix_index import build_char_suffix_index, suffix_tail
 import re
 import pathlib
 from typing import List, Tuple
 
-def debug_case(company, legal_suffixes, top_n=20):
+def debug_case(company, legal_suffixes=None, top_n=20):
     print("ORIG:", repr(company))
     print("--------------")
     
@@ -11,11 +12,10 @@ def debug_case(company, legal_suffixes, top_n=20):
     # This allows us to use its internal helper methods and parse_company_name as intended
     parser_utils_instance = ParserUtils()
     
-    # Temporarily override legal_suffixes_raw for this debug case if needed
-    # In your solution, legal_suffixes are passed directly to the standalone parse_company_name function.
-    # Since it is now a method, we need to explicitly rebuild its internal suffix lists for the debug case.
-    parser_utils_instance.legal_suffixes_raw = legal_suffixes
-    parser_utils_instance.suffix_token_lists = parser_utils_instance._prepare_suffix_lists(legal_suffixes)
+    # Temporarily override the suffix index for this debug case if needed
+    # Suffixes are indexed by their letters and digits only, as parse_company_name compares them
+    if legal_suffixes is not None:
+        parser_utils_instance.legal_suffix_index = build_char_suffix_index(legal_suffixes)
 
     # show tokenization
     tokens = [m.group(0) for m in re.finditer(r'\S+', company)]
@@ -23,31 +23,23 @@ def debug_case(company, legal_suffixes, top_n=20):
     norm_tokens = [parser_utils_instance._norm_token(t) for t in tokens]
     print("NORM TOKENS:", norm_tokens)
     print("--------------")
-    suf_lists = parser_utils_instance.suffix_token_lists
-    print("TOP SUFFIX CANDIDATES (normalized):")
-    for i, s in enumerate(suf_lists[:top_n]):
-        print(f" {i+1}.", " ".join(s))
+    # show the characters a trailing suffix can be made of, and the suffixes among them
+    name = company.strip()
+    index = parser_utils_instance.legal_suffix_index
+    positions = suffix_tail(index, name)
+    chars = [name[i].lower() for i in reversed(positions)]
+    print("SUFFIX TAIL:", "".join(chars))
+    lengths = index.match_lengths(chars)
+    print(f"SUFFIX CANDIDATES (longest first, top {top_n}):")
+    for k in list(reversed(lengths))[:top_n]:
+        start = positions[k - 1]
+        print(f"  {''.join(chars[-k:])!r} at {start}:", repr(name[start:positions[0] + 1]))
     print("--------------")
     
     print("parse_company_name result =>", parser_utils_instance.parse_company_name(company))
-    print("--------------")
-    # show attempted regex patterns for first few suffixes (how they look)
-    for s in suf_lists[:10]:
-        parts = [parser_utils_instance._token_to_regex(t) for t in s]
-        sep = r'(?:[\s\.\,\-\/\&\(\)\\\u2013\u2014]*)'
-        pat = sep.join(parts) + r'\s*$'
-        print("SUFFIX PATTERN:", " ".join(s))
-        print(" PATTERN:", pat)
-        try:
-            m = re.search(pat, company, flags=re.IGNORECASE)
-            print("  matched?", bool(m))
-            if m:
-                print("  match.span():", m.span(), "matched_text:", repr(company[m.start():m.end()]))
-        except re.error as e:
-            print("  pattern error:", e)
     print("==============")
 
 # Usage:
 # legal = pathlib.Path('project/data/legal.txt').read_text().splitlines()
 # debug_case("Tresata pvt ltd.", legal)
-# debug_case("Enno Roggemann GmbH & Co. KG", legal) 
\ No newline at end of file
+# debug_case("Enno Roggemann GmbH & Co. KG", legal)
@@ -0,0 +1,214 @@
+import io
+import mmap
+import os
+from itertools import repeat
+from typing import Callable, Iterator, List, Optional, Tuple
+import pandas as pd
+
+INPUT_ENGINES = ("pandas", "pyarrow")
+PARQUET_SUFFIXES = (".parquet", ".pq")
+# pandas' default missing-value markers, so that both CSV engines read the same values as missing
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+# Bytes per Arrow block when streaming a CSV with pyarrow; batches are re-cut to the requested chunk size
+ARROW_BLOCK_SIZE = 16 * 1024 * 1024
+# Target size of the byte ranges a CSV file is split into for parallel parsing
+RANGE_SIZE = 64 * 1024 * 1024
+QUOTE = ord('"')
+# Bytes scanned at a time when counting quotes, so the scan never copies more than this
+_SCAN_BLOCK = 16 * 1024 * 1024
+
+def _import_pyarrow(what: str):
+    # pyarrow is optional; it is only needed for Parquet input and the pyarrow CSV engine
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.csv
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(f"{what} requires pyarrow (pip install pyarrow).") from None
+    return pyarrow
+
+def is_parquet(path) -> bool:
+    return str(path).lower().endswith(PARQUET_SUFFIXES)
+
+def read_columns(path) -> List[str]:
+    """Column names of a CSV or Parquet file, without reading its rows."""
+    if is_parquet(path):
+        pa = _import_pyarrow("Parquet input")
+        return list(pa.parquet.ParquetFile(path).schema_arrow.names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def _projection(path, columns) -> Optional[List[str]]:
+    # Projected columns in file order (as pandas' usecols returns them); unknown names are an error
+    if columns is None:
+        return None
+    available = read_columns(path)
+    missing = [col for col in columns if col not in available]
+    if missing:
+        raise ValueError(f"Columns not found in {path}: {', '.join(map(str, missing))}")
+    wanted = set(columns)
+    return [col for col in available if col in wanted]
+
+def _to_frame(table) -> pd.DataFrame:
+    # Every column as text, like pd.read_csv(dtype=str): numbers, dates etc. are cast to strings
+    import pyarrow
+    columns = [pyarrow.compute.cast(column, pyarrow.string()) for column in table.columns]
+    return pyarrow.Table.from_arrays(columns, names=table.column_names).to_pandas()
+
+def _arrow_batches(path, projection, engine: str):
+    """Record batches of a Parquet file, or of a CSV file read with the pyarrow engine."""
+    pa = _import_pyarrow("Parquet input" if is_parquet(path) else f"engine '{engine}'")
+    if is_parquet(path):
+        yield from pa.parquet.ParquetFile(path).iter_batches(columns=projection)
+        return
+    names = projection if projection is not None else read_columns(path)
+    convert_options = pa.csv.ConvertOptions(
+        include_columns=projection, column_types={name: pa.string() for name in names},
+        null_values=NA_VALUES, strings_can_be_null=True, quoted_strings_can_be_null=True,
+    )
+    with pa.csv.open_csv(path, read_options=pa.csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+                         parse_options=pa.csv.ParseOptions(newlines_in_values=True),
+                         convert_options=convert_options) as reader:
+        yield from reader
+
+def _empty_frame(path, projection) -> pd.DataFrame:
+    names = projection if projection is not None else read_columns(path)
+    return pd.DataFrame({name: pd.Series([], dtype=str) for name in names})
+
+def read_table(path, columns: Optional[List[str]] = None, nrows: Optional[int] = None,
+               engine: str = "pandas") -> pd.DataFrame:
+    """
+    Read a CSV or Parquet file with every column as strings.
+
+    Args:
+        path: A CSV file, or a Parquet file (.parquet/.pq, needs pyarrow).
+        columns (list, optional): Only read these columns (projection); they come back in file order.
+        nrows (int, optional): Only read this many leading rows.
+        engine (str): "pandas" (C parser) or "pyarrow" (multi-threaded pyarrow CSV reader) for CSV files.
+
+    Returns:
+        pd.DataFrame: The selected columns, as read by `pd.read_csv(path, dtype=str)`.
+    """
+    if engine not in INPUT_ENGINES:
+        raise ValueError(f"Unknown input engine '{engine}'; expected one of {', '.join(INPUT_ENGINES)}.")
+    if engine == "pandas" and not is_parquet(path):
+        return pd.read_csv(path, dtype=str, usecols=columns, nrows=nrows)
+    chunks = list(iter_table(path, chunksize=None, columns=columns, engine=engine, nrows=nrows))
+    if not chunks:
+        return _empty_frame(path, _projection(path, columns))
+    return pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+def iter_table(path, chunksize: Optional[int], columns: Optional[List[str]] = None,
+               engine: str = "pandas", nrows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV or Parquet file in chunks of `chunksize` rows (the whole file if None), every
+    column as strings. Arguments as for read_table; chunk indexes continue across chunks.
+    """
+    if engine not in INPUT_ENGINES:
+        raise ValueError(f"Unknown input engine '{engine}'; expected one of {', '.join(INPUT_ENGINES)}.")
+    if engine == "pandas" and not is_parquet(path):
+        if chunksize is None:
+            yield pd.read_csv(path, dtype=str, usecols=columns, nrows=nrows)
+        else:
+            yield from pd.read_csv(path, dtype=str, usecols=columns, nrows=nrows, chunksize=chunksize)
+        return
+
+    import pyarrow
+    projection = _projection(path, columns)
+    pending, pending_rows, emitted = [], 0, 0
+    for batch in _arrow_batches(path, projection, engine):
+        if nrows is not None:
+            batch = batch.slice(0, nrows - emitted - pending_rows)
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while chunksize is not None and pending_rows >= chunksize:
+            table = pyarrow.Table.from_batches(pending)
+            chunk, rest = table.slice(0, chunksize), table.slice(chunksize)
+            df = _to_frame(chunk)
+            df.index = pd.RangeIndex(emitted, emitted + len(df))
+            yield df
+            emitted += len(df)
+            pending, pending_rows = rest.to_batches(), rest.num_rows
+        if nrows is not None and emitted + pending_rows >= nrows:
+            break
+    if pending_rows:
+        df = _to_frame(pyarrow.Table.from_batches(pending))
+        df.index = pd.RangeIndex(emitted, emitted + len(df))
+        yield df
+
+def _open_mmap(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def count_quotes(path, start: int, end: int) -> int:
+    """Number of quote characters in bytes [start, end) of a file."""
+    mm = _open_mmap(path)
+    if mm is None:
+        return 0
+    with mm:
+        return sum(mm[pos:min(pos + _SCAN_BLOCK, end)].count(QUOTE) for pos in range(start, end, _SCAN_BLOCK))
+
+def _row_boundary(mm, pos: int, quotes_before: int) -> int:
+    """
+    Offset just after the first newline at or after `pos` that ends a CSV row, i.e. that is not
+    inside a quoted field; `quotes_before` is the number of quote characters before `pos`.
+    Escaped quotes ("") count twice, so an even number of quotes means "outside a field".
+    """
+    while True:
+        newline = mm.find(b"\n", pos)
+        if newline == -1:
+            return len(mm)
+        quotes_before += mm[pos:newline].count(QUOTE)
+        if quotes_before % 2 == 0:
+            return newline + 1
+        pos = newline + 1
+
+def csv_row_ranges(path, range_size: int = RANGE_SIZE,
+                   map_func: Callable = map) -> List[Tuple[int, int]]:
+    """
+    Split a CSV file into byte ranges of about `range_size` bytes that each hold whole rows.
+
+    The file is memory-mapped. Every range boundary is a newline outside quotes, so fields with
+    embedded newlines are never cut. The header line is not part of any range. Quote parity at each
+    cut point comes from counting the quotes of every stretch between cut points; `map_func`
+    (e.g. a process pool's `map`) runs those counts, in parallel if it can.
+
+    Returns:
+        list: (start, end) byte offsets, in file order, covering every row after the header.
+    """
+    mm = _open_mmap(path)
+    if mm is None:
+        return []
+    with mm:
+        size = len(mm)
+        data_start = _row_boundary(mm, 0, 0)
+        targets = list(range(data_start, size, max(1, range_size)))
+        quote_counts = list(map_func(count_quotes, repeat(path), targets, targets[1:] + [size]))
+        boundaries, quotes_before = [], 0
+        for target, count in zip(targets, quote_counts):
+            if not boundaries or target >= boundaries[-1]:
+                boundaries.append(target if target == data_start else _row_boundary(mm, target, quotes_before))
+            quotes_before += count
+        boundaries = sorted(set(boundaries + [size]))
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+def read_csv_range(path, start: int, end: int, names: List[str],
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Rows in bytes [start, end) of a CSV file (a range from csv_row_ranges), every column as text.
+
+    Args:
+        names (list): The file's column names, as read_columns returns them.
+        columns (list, optional): Only return these columns; they come back in file order.
+    """
+    mm = _open_mmap(path)
+    if mm is None:
+        return _empty_frame(path, _projection(path, columns))
+    with mm:
+        data = mm[start:end]
+    return pd.read_csv(io.BytesIO(data), header=None, names=names, usecols=columns, dtype=str)
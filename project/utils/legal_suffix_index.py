@@ -0,0 +1,103 @@
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple
+from project.utils.artifact_cache import get_artifact
+from project.utils.data_loader import get_legal_suffixes_set
+
+_TERMINAL = None  # Marks a node where a complete suffix ends; never a valid token
+_WORD_CHAR_RE = re.compile(r'\w')
+
+class LegalSuffixIndex:
+    """
+    Reversed-token trie over legal suffix token sequences.
+
+    A value's tokens are walked from the last one backwards, so finding every suffix that ends the
+    value costs O(number of tokens) instead of one comparison per known suffix.
+    Callers decide how suffixes and values are tokenized; both sides must use the same normalization.
+    """
+
+    def __init__(self, suffix_token_seqs: Iterable[Sequence[str]]):
+        self._root = {}
+        self.max_suffix_len = 0
+        self.size = 0
+        for seq in suffix_token_seqs:
+            if not seq:
+                continue
+            node = self._root
+            for token in reversed(seq):
+                node = node.setdefault(token, {})
+            if _TERMINAL not in node:
+                node[_TERMINAL] = True
+                self.size += 1
+            self.max_suffix_len = max(self.max_suffix_len, len(seq))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def match_lengths(self, tokens: Sequence[str], end: Optional[int] = None) -> List[int]:
+        """
+        Lengths (ascending) of every known suffix that `tokens[:end]` ends with.
+
+        Args:
+            tokens (Sequence[str]): Normalized tokens of the value.
+            end (int, optional): Only consider tokens before this index. Defaults to all tokens.
+
+        Returns:
+            List[int]: Matching suffix lengths in tokens; empty if no suffix matches.
+        """
+        end = len(tokens) if end is None else end
+        lengths = []
+        node = self._root
+        for depth, i in enumerate(range(end - 1, -1, -1), start=1):
+            node = node.get(tokens[i])
+            if node is None:
+                break
+            if _TERMINAL in node:
+                lengths.append(depth)
+        return lengths
+
+    def longest_match(self, tokens: Sequence[str], end: Optional[int] = None) -> int:
+        """Length of the longest known suffix that `tokens[:end]` ends with, or 0 if none."""
+        lengths = self.match_lengths(tokens, end)
+        return lengths[-1] if lengths else 0
+
+def build_char_suffix_index(suffixes: Iterable[str]) -> LegalSuffixIndex:
+    """Index of legal suffixes keyed on their letters and digits, so "S.R.O.", "s. r. o." and "sro" are one entry."""
+    return LegalSuffixIndex("".join(filter(str.isalnum, suffix.lower())) for suffix in suffixes)
+
+def shared_suffix_index() -> LegalSuffixIndex:
+    """The character-keyed index over legal.txt that the parser and the feature extractor both use."""
+    return get_artifact("legal_suffix_chars", lambda: build_char_suffix_index(get_legal_suffixes_set()))
+
+def suffix_tail(index: LegalSuffixIndex, text: str) -> List[int]:
+    """
+    Positions of the letters and digits a legal suffix at the end of text can be made of, last first.
+    Trailing punctuation is skipped, and the characters of a suffix may only be separated by
+    whitespace and at most one dot ("s. r.o." reads as "sro").
+    """
+    positions = []
+    i = len(text) - 1
+    while i >= 0 and not text[i].isalnum():
+        i -= 1
+    while i >= 0 and text[i].isalnum() and len(positions) < index.max_suffix_len:
+        positions.append(i)
+        i -= 1
+        while i >= 0 and text[i].isspace():
+            i -= 1
+        if i >= 0 and text[i] == '.':
+            i -= 1
+            while i >= 0 and text[i].isspace():
+                i -= 1
+    return positions
+
+def find_legal_suffix(index: LegalSuffixIndex, text: str) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) span of the longest legal suffix of a character-keyed index that ends text and
+    does not start inside a word, or None. Trailing punctuation after `end` is not part of it.
+    """
+    positions = suffix_tail(index, text)
+    chars = [text[i].lower() for i in reversed(positions)]
+    for k in reversed(index.match_lengths(chars)):
+        start = positions[k - 1]
+        if start == 0 or not _WORD_CHAR_RE.match(text[start - 1]):
+            return start, positions[0] + 1
+    return None
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry and counts hits and misses."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+def _value_key(value):
+    # Equal values of different types (1, 1.0, True) hash alike but parse to different results
+    return value if type(value) is str else (type(value), value)
+
+def factorize_values(values: pd.Series) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Split a column into codes and distinct values, so that `uniques[codes[i]]` is equivalent to `values[i]`.
+
+    pandas factorizes every missing marker (None, NaN, NaT, ...) into one sentinel, but they
+    stringify differently; each type of missing marker is therefore kept as its own distinct value.
+    Likewise 1, 1.0 and True are one value to pandas, so mixed object columns are factorized on
+    (type, value) pairs.
+    """
+    codes, uniques = pd.factorize(values)
+    uniques = list(uniques)
+    if values.dtype == object and any(type(value) is not str for value in uniques):
+        present = np.flatnonzero(codes != -1)
+        keys = pd.Series([(type(value), value) for value in values.to_numpy(dtype=object)[present]], dtype=object)
+        key_codes, key_uniques = pd.factorize(keys)
+        codes[present] = key_codes
+        uniques = [value for _, value in key_uniques]
+    na_positions = np.flatnonzero(codes == -1)
+    if len(na_positions):
+        na_values = values.to_numpy(dtype=object)[na_positions]
+        type_codes, types = pd.factorize(pd.Series([type(value) for value in na_values], dtype=object))
+        first_of_type = [na_values[np.argmax(type_codes == i)] for i in range(len(types))]
+        codes[na_positions] = len(uniques) + type_codes
+        uniques.extend(first_of_type)
+    return codes, uniques
+
+def map_unique(values: pd.Series, compute: Callable[[List[Any]], List[Any]],
+               cache: Optional[LRUCache] = None) -> pd.Series:
+    """
+    Evaluate a function once per distinct value of a column and broadcast the results back.
+
+    Args:
+        values (pd.Series): The column to map.
+        compute (Callable): Takes a list of distinct values and returns their results in the same order.
+        cache (LRUCache, optional): Results kept across calls, e.g. across the chunks of a streamed file.
+
+    Returns:
+        pd.Series: One result per value, aligned with `values.index`.
+    """
+    codes, uniques = factorize_values(values)
+    results = np.empty(len(uniques), dtype=object)
+    missing = list(range(len(uniques)))
+    if cache is not None:
+        missing = []
+        for i, value in enumerate(uniques):
+            result = cache.get(_value_key(value), _MISSING)
+            if result is _MISSING:
+                missing.append(i)
+            else:
+                results[i] = result
+    if missing:
+        computed = compute([uniques[i] for i in missing])
+        for i, result in zip(missing, computed):
+            results[i] = result
+            if cache is not None:
+                cache.put(_value_key(uniques[i]), result)
+    return pd.Series(results[codes], index=values.index, dtype=object)
+
+def map_unique_fields(values: pd.Series, parse: Callable[[Any], Tuple], n_fields: int,
+                      cache: Optional[LRUCache] = None,
+                      compute: Optional[Callable[[List[Any]], List[Tuple]]] = None) -> List[np.ndarray]:
+    """
+    Struct-of-arrays variant of map_unique for functions returning a fixed number of fields.
+
+    Each distinct value is parsed once and its fields are written straight into one preallocated
+    object array per field; every field is then broadcast back to the rows with a single take.
+    No per-row tuple (or Series of tuples) is built.
+
+    Args:
+        values (pd.Series): The column to map.
+        parse (Callable): Takes one value and returns its `n_fields` fields.
+        n_fields (int): Number of fields `parse` returns.
+        cache (LRUCache, optional): Results (tuples of fields) kept across calls.
+        compute (Callable, optional): Evaluates a list of distinct values elsewhere (e.g. in a
+            worker pool) and returns their results in the same order; `parse` is then not called.
+
+    Returns:
+        list[np.ndarray]: One object array per field, aligned with `values`.
+    """
+    codes, uniques = factorize_values(values)
+    fields = [np.empty(len(uniques), dtype=object) for _ in range(n_fields)]
+    missing = list(range(len(uniques)))
+    if cache is not None:
+        missing = []
+        for i, value in enumerate(uniques):
+            result = cache.get(_value_key(value), _MISSING)
+            if result is _MISSING:
+                missing.append(i)
+            else:
+                for field, item in zip(fields, result):
+                    field[i] = item
+    if compute is not None:
+        results = compute([uniques[i] for i in missing]) if missing else []
+    else:
+        results = (parse(uniques[i]) for i in missing)
+    for i, result in zip(missing, results):
+        for field, item in zip(fields, result):
+            field[i] = item
+        if cache is not None:
+            cache.put(_value_key(uniques[i]), result)
+    return [field[codes] for field in fields]
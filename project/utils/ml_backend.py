@@ -0,0 +1,154 @@
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+LABELS = ["PhoneNumber", "Date", "Country", "CompanyName", "Other"]
+MODEL_TYPES = ("gbt", "logreg")
+# phoneNumber.csv also contains company/country names and noise; only these rows are phone numbers
+PHONE_FORMATS = {
+    "National (local style)", "International (E.164)", "Plain Digits", "Separated by Dashes",
+    "Separated by Spaces", "Parentheses Variations", "Short Codes", "Extension Numbers",
+    "With Country Code + Spaces/Dashes",
+}
+
+def label_pools(random_state: Optional[int] = 0) -> dict:
+    """
+    Distinct example values per label, taken from the bundled data files.
+
+    Rows of phoneNumber.csv and dates.csv whose format occurs only once are noise (random strings,
+    names). They make up the "Other:text" pool; generated identifiers and amounts make up
+    "Other:integer" and "Other:decimal". A ":variant" suffix keeps kinds of values that never share a
+    column apart; the label is the part before the colon.
+    """
+    from project.utils.data_loader import get_company_df, get_countries_set, get_dates_df, get_phone_numbers_df
+    rng = np.random.default_rng(random_state)
+    phones = get_phone_numbers_df()
+    dates = get_dates_df()
+    phone_formats = phones["format_type"].value_counts()
+    date_formats = dates["format"].value_counts()
+    noise = pd.concat([
+        phones.loc[phones["format_type"].isin(phone_formats[phone_formats == 1].index), "number"],
+        dates.loc[dates["format"].isin(date_formats[date_formats == 1].index), "date"],
+    ]).dropna().astype(str)
+    # Identifiers and amounts of every magnitude, so short numeric columns are not taken for phone numbers
+    magnitudes = 10 ** rng.uniform(0, 7, size=2000)
+    return {
+        "PhoneNumber": phones.loc[phones["format_type"].isin(PHONE_FORMATS), "number"].dropna().astype(str).unique(),
+        "Date": dates.loc[dates["format"].isin(date_formats[date_formats > 1].index), "date"].dropna().astype(str).unique(),
+        "Country": np.array(sorted(get_countries_set()), dtype=object),
+        "CompanyName": get_company_df()["company"].dropna().astype(str).unique(),
+        "Other:text": noise.unique(),
+        "Other:integer": np.array([str(int(v)) for v in magnitudes[:1000]] + [str(i) for i in range(1000)], dtype=object),
+        "Other:decimal": np.array([f"{v:.2f}" for v in magnitudes[1000:]], dtype=object),
+    }
+
+def split_pools(pools: dict, test_fraction: float = 0.2, random_state: Optional[int] = 0) -> Tuple[dict, dict]:
+    """Split every pool's distinct values into disjoint train and test pools."""
+    rng = np.random.default_rng(random_state)
+    train, test = {}, {}
+    for label, values in pools.items():
+        values = rng.permutation(np.asarray(values, dtype=object))
+        n_test = max(1, int(len(values) * test_fraction))
+        train[label], test[label] = values[n_test:], values[:n_test]
+    return train, test
+
+def column_feature_matrix(feature_extractor, columns: Sequence) -> np.ndarray:
+    """
+    Column-level feature matrix: one float32 row per column, holding the mean and the standard
+    deviation over the column's values of every FeatureExtractor feature.
+
+    All columns are concatenated and go through a single `extract_features` call, then reduced
+    per column, so a batch of columns costs one pass over the feature extractor.
+    """
+    series = [pd.Series(column, dtype=object).reset_index(drop=True) for column in columns]
+    sizes = np.array([len(s) for s in series], dtype=np.int64)
+    values = pd.concat(series, ignore_index=True) if series else pd.Series([], dtype=object)
+    features = feature_extractor.extract_features(values).to_numpy(dtype=np.float64)
+    n_features = features.shape[1]
+
+    sums = np.zeros((len(series), n_features))
+    squares = np.zeros((len(series), n_features))
+    non_empty = sizes > 0
+    if non_empty.any():
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])[non_empty]
+        sums[non_empty] = np.add.reduceat(features, starts, axis=0)
+        squares[non_empty] = np.add.reduceat(features ** 2, starts, axis=0)
+    counts = np.maximum(sizes, 1)[:, None]
+    means = sums / counts
+    stds = np.sqrt(np.maximum(squares / counts - means ** 2, 0.0))
+    return np.hstack([means, stds]).astype(np.float32)
+
+def _make_estimator(model_type: str, random_state: int):
+    # scikit-learn is only imported when a model is trained
+    if model_type == "gbt":
+        from sklearn.ensemble import HistGradientBoostingClassifier
+        return HistGradientBoostingClassifier(max_iter=200, learning_rate=0.1, random_state=random_state)
+    if model_type == "logreg":
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler
+        return make_pipeline(StandardScaler(), LogisticRegression(max_iter=2000))
+    raise ValueError(f"Unknown model type '{model_type}'; expected one of {', '.join(MODEL_TYPES)}.")
+
+class ColumnModel:
+    """
+    Trained column classifier over `column_feature_matrix` rows.
+
+    Wraps a scikit-learn estimator (gradient-boosted trees or logistic regression); a batch of
+    columns is classified with one vectorized `predict_proba` call.
+    """
+
+    def __init__(self, model_type: str = "gbt", random_state: int = 0):
+        self.model_type = model_type
+        self.estimator = _make_estimator(model_type, random_state)
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.estimator.classes_
+
+    def fit(self, X: np.ndarray, labels: Sequence[str]) -> "ColumnModel":
+        self.estimator.fit(np.asarray(X, dtype=np.float32), np.asarray(labels))
+        return self
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        return self.estimator.predict_proba(np.asarray(X, dtype=np.float32))
+
+    def predict(self, X: np.ndarray) -> List[Tuple[str, float]]:
+        """(label, probability of that label) per row of X."""
+        if len(X) == 0:
+            return []
+        proba = self.predict_proba(X)
+        best = proba.argmax(axis=1)
+        return [(str(self.classes_[i]), float(proba[row, i])) for row, i in enumerate(best)]
+
+def training_columns(pools: dict, n_columns: int, min_size: int = 20, max_size: int = 300,
+                     max_noise: float = 0.2, random_state: Optional[int] = 0) -> Tuple[List[pd.Series], List[str]]:
+    """
+    Synthetic labelled columns drawn from per-label pools of example values.
+
+    Each column takes a random number of values from one pool, and up to `max_noise` of it is
+    replaced by values of other labels (and missing values), as in real, dirty columns.
+
+    Args:
+        pools (dict): Label (optionally with a ":variant" suffix, see label_pools) -> array of example values.
+        n_columns (int): Columns generated per pool.
+
+    Returns:
+        tuple: (columns, labels)
+    """
+    rng = np.random.default_rng(random_state)
+    names = list(pools)
+    columns, column_labels = [], []
+    for name in names:
+        label = name.split(":")[0]
+        others = [other for other in names if other.split(":")[0] != label]
+        for _ in range(n_columns):
+            size = int(rng.integers(min_size, max_size + 1))
+            values = rng.choice(pools[name], size=size).astype(object)
+            noisy = np.flatnonzero(rng.random(size) < rng.uniform(0, max_noise))
+            for i in noisy:
+                other = others[rng.integers(len(others))]
+                values[i] = rng.choice(pools[other]) if rng.random() < 0.8 else None
+            columns.append(pd.Series(values, dtype=object))
+            column_labels.append(label)
+    return columns, column_labels
@@ -0,0 +1,134 @@
+import os
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "parquet", "arrow")
+# Low-cardinality parsed fields, stored dictionary-encoded in the columnar formats
+DICTIONARY_COLUMNS = ("parsed_country", "parsed_legal_suffix")
+
+def _import_pyarrow(output_format: str):
+    # pyarrow is optional; it is only needed for the columnar output formats
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(f"Output format '{output_format}' requires pyarrow (pip install pyarrow).") from None
+    return pyarrow
+
+class _GrowingDictionary:
+    """
+    Dictionary of one column that only ever grows across chunks, so that each chunk's dictionary
+    extends the previous one. Arrow IPC files accept such dictionary deltas (but not replacements),
+    and the codes of a value stay the same across the whole file.
+    """
+
+    def __init__(self, pa):
+        self.pa = pa
+        self.index = {}
+        self.values = []
+
+    def encode(self, values: pd.Series):
+        for value in pd.unique(values.dropna()):
+            if value not in self.index:
+                self.index[value] = len(self.values)
+                self.values.append(str(value))
+        codes = values.map(self.index)
+        missing = codes.isna().to_numpy()
+        indices = self.pa.array(codes.fillna(0).to_numpy(dtype=np.int32), mask=missing)
+        return self.pa.DictionaryArray.from_arrays(indices, self.pa.array(self.values, type=self.pa.string()))
+
+class ChunkWriter:
+    """
+    Writes parser output frames chunk by chunk to a CSV, Parquet or Arrow IPC file.
+
+    All chunks must have the same columns. For Parquet and Arrow every column is stored as a
+    (nullable) string, and the columns in DICTIONARY_COLUMNS as dictionary<int32, string>.
+    Use as a context manager, or call close() to finish the file.
+
+    A CSV file can be continued from `resume_offset` bytes, the size `sync()` reported after the
+    last complete chunk: anything after it is cut off and new chunks are appended without a header.
+    """
+
+    def __init__(self, path, output_format: str = "csv", resume_offset: Optional[int] = None):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{output_format}'; expected one of {', '.join(OUTPUT_FORMATS)}.")
+        if resume_offset is not None and output_format != "csv":
+            raise ValueError(f"Only CSV output can be resumed; a partial {output_format} file cannot be appended to.")
+        self.path = path
+        self.output_format = output_format
+        self.pa = _import_pyarrow(output_format) if output_format != "csv" else None
+        self.rows = 0
+        self.chunks = 0
+        self._file = None
+        self._writer = None
+        self._schema = None
+        self._dictionaries = {}
+        self._header_written = False
+        if resume_offset is not None:
+            os.truncate(path, resume_offset)
+            self._file = open(path, "a", newline="", encoding="utf-8")
+            self._header_written = True
+
+    def write(self, df: pd.DataFrame):
+        """Append one chunk; the first chunk (even an empty one) also writes the header/schema."""
+        if self.output_format == "csv":
+            if self._file is None:
+                self._file = open(self.path, "w", newline="", encoding="utf-8")
+            df.to_csv(self._file, header=not self._header_written, index=False)
+            self._header_written = True
+        else:
+            table = self._to_table(df)
+            if self._writer is None:
+                self._writer = self._open_writer()
+            self._writer.write_table(table)
+        self.rows += len(df)
+        self.chunks += 1
+
+    def _to_table(self, df: pd.DataFrame):
+        pa = self.pa
+        if self._schema is None:
+            self._schema = pa.schema([
+                pa.field(str(col), pa.dictionary(pa.int32(), pa.string()) if col in DICTIONARY_COLUMNS else pa.string())
+                for col in df.columns
+            ])
+            self._dictionaries = {col: _GrowingDictionary(pa) for col in df.columns if col in DICTIONARY_COLUMNS}
+        arrays = []
+        for col in df.columns:
+            values = df[col].astype(object)
+            if col in self._dictionaries:
+                arrays.append(self._dictionaries[col].encode(values))
+            else:
+                arrays.append(pa.array(values, type=pa.string(), from_pandas=True))
+        return pa.Table.from_arrays(arrays, schema=self._schema)
+
+    def _open_writer(self):
+        pa = self.pa
+        if self.output_format == "parquet":
+            return pa.parquet.ParquetWriter(self.path, self._schema, use_dictionary=[f.name for f in self._schema
+                                                                                     if f.name in DICTIONARY_COLUMNS])
+        options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        return pa.ipc.new_file(self.path, self._schema, options=options)
+
+    def sync(self) -> int:
+        """Flush the CSV output to disk and return its size in bytes."""
+        if self._file is None:
+            return 0
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,146 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import time
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+# Per-process state, set once by the pool initializers
+_worker_parser_utils = None
+_worker_classifier = None
+
+def _init_parser_worker(parser_kwargs):
+    global _worker_parser_utils
+    from project.utils.parser_utils import ParserUtils
+    _worker_parser_utils = ParserUtils(**parser_kwargs)
+
+def _parse_shard(method_name, values):
+    method = getattr(_worker_parser_utils, method_name)
+    return [method(value) for value in values]
+
+def _parse_range(path, start, end, names, columns, build):
+    from project.utils.input_reader import read_csv_range
+    return build(read_csv_range(path, start, end, names, columns), parser_utils=_worker_parser_utils)
+
+def _init_classifier_worker(model_path):
+    global _worker_classifier
+    if model_path is not None:
+        import joblib
+        _worker_classifier = joblib.load(model_path)
+    else:
+        from project.utils.classifier import Classifier, FeatureExtractor
+        _worker_classifier = Classifier(FeatureExtractor())
+
+def _classify_values(values, max_sample_size):
+    start = time.perf_counter()
+    try:
+        column_values = pd.Series(values, dtype=object)
+        if max_sample_size:
+            result = _worker_classifier.classify_column_sampled(column_values, max_sample_size=max_sample_size)
+        else:
+            label, confidence = _worker_classifier.classify_column(column_values)
+            result = {"label": label, "confidence": float(confidence)}
+    except Exception as e:
+        result = {"error": str(e)}
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+class ParallelParser:
+    """
+    Process pool for the CPU-bound ParserUtils methods.
+
+    Each worker builds its own ParserUtils (with `parser_kwargs`, e.g. the phone regions) once at
+    start-up; only the values and the results cross process boundaries. Rows are split into
+    contiguous shards and reassembled in their original order.
+    """
+
+    def __init__(self, workers: int, shards_per_worker: int = 4, min_shard_size: int = 1000,
+                 parser_kwargs: Optional[dict] = None):
+        self.workers = workers
+        self.shards_per_worker = shards_per_worker
+        self.min_shard_size = min_shard_size
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_parser_worker,
+                                            initargs=(dict(parser_kwargs or {}),))
+
+    def map(self, method_name: str, values: pd.Series) -> pd.Series:
+        """
+        Apply `ParserUtils.<method_name>` to every value, like `values.apply(...)`.
+
+        Args:
+            method_name (str): Name of a single-value ParserUtils method, e.g. "parse_phone_number".
+            values (pd.Series): The values to parse.
+
+        Returns:
+            pd.Series: One result per value, aligned with `values.index`.
+        """
+        n_shards = max(1, min(self.workers * self.shards_per_worker, len(values) // self.min_shard_size))
+        shards = np.array_split(values.to_numpy(dtype=object), n_shards)
+        results = [result for shard in self.executor.map(_parse_shard, repeat(method_name), shards) for result in shard]
+        return pd.Series(results, index=values.index, dtype=object)
+
+    def map_ranges(self, path, ranges, names, columns, build, max_pending: Optional[int] = None):
+        """
+        Read and parse byte ranges of a CSV file (see input_reader.csv_row_ranges) in the workers.
+
+        Each worker reads its range straight from the file and returns `build(df, parser_utils=...)`
+        for it, e.g. the output frame of those rows; `build` must be picklable (a module-level
+        function or a functools.partial of one). Results are yielded in range order, with at most
+        `max_pending` ranges (default: two per worker) in flight, so memory stays bounded.
+        """
+        max_pending = max_pending or 2 * self.workers
+        pending = deque()
+        for start, end in ranges:
+            pending.append(self.executor.submit(_parse_range, path, start, end, names, columns, build))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ParallelClassifier:
+    """
+    Process pool that classifies whole columns, one task per column.
+
+    Each worker loads the classifier (and with it the dictionaries and compiled patterns) once at
+    start-up from `model_path`, or builds a fresh Classifier when no path is given. Only the column
+    values are sent per task, and results come back in the order the columns were submitted.
+    """
+
+    def __init__(self, workers: int, model_path=None):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_classifier_worker,
+                                            initargs=(str(model_path) if model_path is not None else None,))
+
+    def classify_columns(self, columns, max_sample_size=None):
+        """
+        Classify several columns in parallel.
+
+        Args:
+            columns (list): Column values, one list/Series per column.
+            max_sample_size (int, optional): Use `Classifier.classify_column_sampled` with this bound.
+
+        Returns:
+            list[dict]: Per column, in input order, a dict with `label` and `confidence` (plus the
+                sampling details in sampling mode), or with `error` if classification failed.
+                `seconds` is the time the worker spent on the column.
+        """
+        payloads = [values.tolist() if isinstance(values, pd.Series) else list(values) for values in columns]
+        return list(self.executor.map(_classify_values, payloads, repeat(max_sample_size)))
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,29 +1,71 @@
 import phonenumbers
 import re
 import os
+import functools
 from phonenumbers import geocoder
-from typing import List, Tuple
-from project.utils.data_loader import GLOBAL_LEGAL_SUFFIXES_SET, GLOBAL_COUNTRIES_SET
+import numpy as np
+import pandas as pd
+from typing import Callable, List, Optional, Tuple
+from project.utils.data_loader import get_countries_set
+from project.utils.legal_suffix_index import find_legal_suffix, shared_suffix_index
+from project.utils.memo import LRUCache, factorize_values, map_unique, map_unique_fields
+from project.utils.artifact_cache import get_artifact
+
+# phonenumbers only starts parsing at a digit or a plus sign; anything without one is rejected by it
+_PHONE_START_RE = re.compile(r'[+\uFF0B\d]')
+_DIGIT_RE = re.compile(r'\d')
+
+@functools.lru_cache(maxsize=None)
+def min_national_number_length() -> int:
+    """Fewest digits any valid national number has, over the metadata of every region."""
+    lengths = []
+    for country_code, regions in phonenumbers.COUNTRY_CODE_TO_REGION_CODE.items():
+        for region in regions:
+            metadata = phonenumbers.PhoneMetadata.metadata_for_region_or_calling_code(country_code, region)
+            if metadata is not None and metadata.general_desc is not None and metadata.general_desc.possible_length:
+                lengths.append(min(metadata.general_desc.possible_length))
+    return min(lengths, default=1)
+
+@functools.lru_cache(maxsize=None)
+def country_name_table() -> dict:
+    """
+    English country name for every (country calling code, region) in the phonenumbers metadata,
+    as `geocoder.country_name_for_number` would name a number of that region.
+    """
+    table = {}
+    for country_code, regions in phonenumbers.COUNTRY_CODE_TO_REGION_CODE.items():
+        for region in regions:
+            names = geocoder.LOCALE_DATA.get(region, {})
+            name = names.get("en", "")
+            if name.startswith("*"):
+                # "*<lang>": the name is only held in the entry for that language
+                name = names.get(name[1:], "")
+            table[(country_code, region)] = name
+    return table
+
+DEFAULT_PHONE_REGION = "US"
+# Output columns of the batch parsers, named as in parser.py's output file
+PHONE_FIELDS = ("parsed_country", "parsed_phone_number")
+COMPANY_FIELDS = ("parsed_company_name", "parsed_legal_suffix")
 
 class ParserUtils:
-    def __init__(self):
-        self.countries_set = GLOBAL_COUNTRIES_SET
+    def __init__(self, cache_size: Optional[int] = None, default_region: str = DEFAULT_PHONE_REGION,
+                 fallback_regions: Optional[List[str]] = None):
+        self.countries_set = get_artifact("countries_set", get_countries_set)
+        # Phone numbers without a country code are tried in the default region, then in each fallback
+        self.default_region = default_region
+        self.fallback_regions = [region for region in (fallback_regions or []) if region != default_region]
+        # Optional per-method LRU caches of parse results, kept across calls (e.g. streamed chunks)
+        self.cache_size = cache_size
+        self.caches = {}
         
-        # --- Legal Suffix Regex Setup (from part b/classifier.py) ---
-        suffixes = {s.strip() for s in GLOBAL_LEGAL_SUFFIXES_SET if s.strip()}
-        flexible_patterns = []
-        for s in suffixes:
-            core = "".join(filter(str.isalnum, s))
-            if not core:
-                continue
-            pattern = r"\s*\.?\s*".join(list(core)) # Escape backslashes for string literal
-            flexible_patterns.append(pattern)
-        
-        flexible_patterns = sorted(flexible_patterns, key=len, reverse=True)
-        self.legal_suffix_regex = re.compile(
-            r"(?<!\w)(" + "|".join(flexible_patterns) + r")((?!\\w)|[.,!?;:\s]*)", # Adjusted regex for non-word boundary after suffix, allowing trailing punctuation/whitespace
-            re.IGNORECASE
-        )
+        # --- Legal Suffix Index Setup ---
+        # Shared with FeatureExtractor, so a value has a legal suffix for both or for neither
+        self.legal_suffix_index = shared_suffix_index()
+
+    @property
+    def phone_regions(self) -> List[str]:
+        return [self.default_region] + self.fallback_regions
 
     _WORD_RE = re.compile(r'\S+')  # tokens: contiguous non-whitespace sequences
 
@@ -31,6 +73,9 @@ class ParserUtils:
         """Normalize a single token for comparison (lower, strip dots, normalize '&'/'and', remove surrounding punctuation)."""
         if not tok:
             return ""
+        if tok.isascii() and tok.isalnum():  # nothing to strip, skip the regex passes
+            s = tok.lower()
+            return '&' if s == 'and' else s
         s = tok.lower()
         s = re.sub(r'\band\b', '&', s)       # unify "and" -> "&"
         s = s.replace('.', '')                # remove dots
@@ -49,96 +94,164 @@ class ParserUtils:
             tokens.append((m.group(0), m.start(), m.end()))
         return tokens
 
-    def _prepare_suffix_lists(self, legal_suffixes: List[str]) -> List[Tuple[List[str], str]]:
+    def map_unique(self, values: pd.Series, method_name: str,
+                   compute: Optional[Callable[[List], List]] = None) -> pd.Series:
         """
-        Return a deduped list of normalized suffix token lists, sorted longest-first.
-        Each suffix list is a list of normalized tokens (no punctuation).
-        Also returns the original raw suffix string for precise slicing.
+        Apply a single-value parse method (e.g. "parse_phone_number") once per distinct value of
+        `values` and broadcast the results back, so cost scales with cardinality, not row count.
+        `compute` may evaluate the distinct values elsewhere (e.g. a worker pool); by default the
+        method is called in-process. With `cache_size` set, results are also memoized across calls.
         """
-        normalized_with_raw = []
-        for raw_suf in legal_suffixes:
-            if not raw_suf:
-                continue
-            toks = [t for t in re.split(r'\s+', raw_suf.strip()) if t]
-            norm_toks = tuple(t for t in (self._norm_token(tok) for tok in toks) if t)
-            if len(norm_toks) == 0:
-                continue
-            normalized_with_raw.append((list(norm_toks), raw_suf)) # Store as list for later mutability if needed, and raw string
-        
-        # Deduplicate and sort by number of tokens then joined-length (both descending)
-        uniq_map = {}
-        for norm_seq, raw_suf in normalized_with_raw:
-            key = " ".join(norm_seq)
-            if key not in uniq_map or len(raw_suf) > len(uniq_map[key][1]):
-                uniq_map[key] = (norm_seq, raw_suf)
-                
-        uniq = list(uniq_map.values())
-        uniq.sort(key=lambda item: (-len(item[0]), -len(" ".join(item[0]))))
-        return uniq
-
-    def _build_normalized_suffix_token_lists(self, legal_suffixes: List[str]) -> List[Tuple[List[str], str]]:
+        if compute is None:
+            method = getattr(self, method_name)
+            compute = lambda distinct: [method(value) for value in distinct]
+        cache = None
+        if self.cache_size:
+            cache = self.caches.setdefault(method_name, LRUCache(self.cache_size))
+        return map_unique(values, compute, cache)
+
+    def map_unique_fields(self, values: pd.Series, method_name: str, fields: Tuple[str, ...],
+                          compute: Optional[Callable[[List], List]] = None) -> pd.DataFrame:
         """
-        From raw suffix strings, build normalized token lists sorted by token count desc (longest first).
-        Returns list of normalized token lists along with their original raw string.
+        Like map_unique, but the fields of each result go into their own column: returns a
+        DataFrame with one column per name in `fields`, aligned with `values.index`, filled from
+        preallocated arrays instead of a Series of tuples. Shares the `cache_size` caches with map_unique.
         """
-        normalized_with_raw = []
-        for raw_suf in legal_suffixes:
-            if not raw_suf:
-                continue
-            toks = [t for t in re.split(r'\s+', raw_suf.strip()) if t]
-            norm_toks = [t for t in (self._norm_token(tok) for tok in toks) if t]
-            if norm_toks:
-                normalized_with_raw.append((norm_toks, raw_suf))
-        
-        # Deduplicate and sort by number of tokens then joined-length (both descending)
-        uniq_map = {}
-        for norm_seq, raw_suf in normalized_with_raw:
-            key = " ".join(norm_seq)
-            # Keep the raw suffix from the first occurrence for uniqueness, or the one that's longer if order matters
-            if key not in uniq_map or len(raw_suf) > len(uniq_map[key][1]):
-                uniq_map[key] = (norm_seq, raw_suf)
-                
-        uniq = list(uniq_map.values())
-        uniq.sort(key=lambda item: (-len(item[0]), -len(" ".join(item[0]))))
-        return uniq
-
-    def _token_to_regex(self, tok: str) -> str:
+        cache = None
+        if self.cache_size:
+            cache = self.caches.setdefault(method_name, LRUCache(self.cache_size))
+        arrays = map_unique_fields(values, getattr(self, method_name), len(fields), cache, compute)
+        return pd.DataFrame(dict(zip(fields, arrays)), index=values.index)
+
+    def _phone_in_region(self, text: str, region: str) -> Optional[Tuple[str, str]]:
+        """(country, national number) if `text` is a valid number when dialled from `region`, else None."""
+        try:
+            p = phonenumbers.parse(text, region)
+        except phonenumbers.NumberParseException:
+            return None
+        # Same check as phonenumbers.is_valid_number, keeping the region it resolves so the
+        # country name is a table lookup instead of a second pass over the region metadata
+        number_region = phonenumbers.region_code_for_number(p)
+        if not phonenumbers.is_valid_number_for_region(p, number_region):
+            return None
+        country = country_name_table().get((p.country_code, number_region), "")
+        # A calling code shared by several regions (e.g. +1) is left unnamed when the number
+        # is valid in more than one of them (toll-free, non-geographic), like the geocoder does
+        shared = phonenumbers.COUNTRY_CODE_TO_REGION_CODE[p.country_code]
+        if len(shared) > 1 and any(other != number_region and phonenumbers.is_valid_number_for_region(p, other)
+                                   for other in shared):
+            country = ""
+        return country, str(p.national_number)
+
+    def _parse_phone(self, number_str, regions: List[str]) -> Tuple[str, str]:
+        text = str(number_str)
+        # Cheap rejections of strings that phonenumbers cannot accept as a valid number: no digit or
+        # plus sign to start from, or too few digits (unless 3+ letters make it a vanity number)
+        start = _PHONE_START_RE.search(text)
+        if not start or (
+                len(_DIGIT_RE.findall(text)) < min_national_number_length() and sum(map(str.isalpha, text)) < 3):
+            return "", text.strip()
+        # A number written with its country code parses the same from every region
+        if start.group() in "+\uFF0B":
+            regions = regions[:1]
+        for region in regions:
+            try:
+                parsed = self._phone_in_region(text, region)
+            except Exception:
+                parsed = None
+            if parsed is not None:
+                return parsed
+        return "", text.strip()
+
+    def parse_phone_number(self, number_str: str, default_region: Optional[str] = None) -> Tuple[str, str]:
         """
-        Build a permissive regex for a single token that:
-        - Matches the token case-insensitively
-        - Allows optional dots after token letters (e.g., "pvt." vs "pvt")
-        - Allows small punctuation around token
+        Parse one phone number into (country name, national number), or ("", original) if it is not
+        a valid number. Numbers without a country code are read as dialled from `default_region`;
+        without it, from the instance's default region and then each of its fallback regions.
         """
-        if tok == '&':
-            # allow '&' or 'and' (case-insensitive), possibly with surrounding punctuation/spaces
-            return r'(?:&|\band\b)'
-        # escape token but allow optional dot(s) inside/after (e.g., "co." "gmbh.")
-        esc = re.escape(tok)
-        # allow optional dots immediately after token characters (common in abbreviations)
-        # we will accept 0+ dots or spaces/punctuation right after token
-        return esc + r'\.?'
-
-    def parse_phone_number(self, number_str: str) -> Tuple[str, str]:
+        if default_region:
+            return self._parse_phone(number_str, [default_region])
+        return self._parse_phone(number_str, self.phone_regions)
+
+    def infer_phone_region(self, values: pd.Series, regions: List[str], sample_size: int = 500,
+                           random_state: int = 0) -> str:
+        """
+        Region (of `regions`) in which most of a sample of the column's distinct national-format
+        numbers are valid. Numbers written with a country code do not depend on the region and
+        are left out; ties, and columns with nothing to decide on, go to the earliest region.
+        """
+        regions = list(regions)
+        if len(regions) < 2:
+            return regions[0]
+        _, uniques = factorize_values(values)
+        candidates = []
+        for value in uniques:
+            start = _PHONE_START_RE.search(str(value))
+            if start and start.group() not in "+\uFF0B":
+                candidates.append(str(value))
+        if len(candidates) > sample_size:
+            rng = np.random.default_rng(random_state)
+            candidates = [candidates[i] for i in rng.choice(len(candidates), size=sample_size, replace=False)]
+        valid_counts = [sum(self._is_valid_phone(value, region) for value in candidates) for region in regions]
+        return regions[int(np.argmax(valid_counts))]
+
+    def _is_valid_phone(self, text: str, region: str) -> bool:
         try:
-            p = phonenumbers.parse(str(number_str), "US")
-            if phonenumbers.is_valid_number(p):
-                country = geocoder.country_name_for_number(p, "en")
-                number = str(p.national_number)
-                return country, number
+            return self._phone_in_region(text, region) is not None
         except Exception:
-            pass
-        return "", str(number_str).strip()
+            return False
+
+    def parse_phone_numbers(self, values: pd.Series, regions: Optional[List[str]] = None,
+                            sample_size: int = 500, infer_region: bool = True,
+                            compute: Optional[Callable[[List], List]] = None) -> pd.DataFrame:
+        """
+        Parse a whole phone column into a country and a number column.
+
+        With `infer_region`, the column's dominant region is inferred from a sample of its values
+        (infer_phone_region); every distinct value is parsed in that region, and only the values
+        that are not valid there are retried in the other regions, in the given order. Otherwise
+        the regions are tried in the given order, as parse_phone_number does.
+
+        Args:
+            values (pd.Series): The phone column.
+            regions (list, optional): Candidate regions, e.g. ["US", "IN", "GB"]; by default the
+                instance's default and fallback regions.
+            sample_size (int): Distinct values used to infer the dominant region.
+            infer_region (bool): Infer the dominant region first.
+            compute (Callable, optional): Evaluates `parse_phone_number` for a list of distinct
+                values elsewhere (e.g. a pool of identically configured ParserUtils). Only valid
+                when the resulting region order is the instance's own.
+
+        Returns:
+            pd.DataFrame: PHONE_FIELDS columns (country, national number), aligned with `values.index`.
+        """
+        regions = list(regions) if regions else self.phone_regions
+        order = regions
+        if infer_region and len(regions) > 1:
+            dominant = self.infer_phone_region(values, regions, sample_size)
+            order = [dominant] + [region for region in regions if region != dominant]
+        if order == self.phone_regions:
+            # Same results as parse_phone_number, so its cache (and a pool running it) can be used
+            return self.map_unique_fields(values, "parse_phone_number", PHONE_FIELDS, compute)
+        if compute is not None:
+            raise ValueError("compute runs parse_phone_number, which uses the instance's own region order; "
+                             "pass infer_region=False or regions matching phone_regions.")
+        arrays = map_unique_fields(values, lambda value: self._parse_phone(value, order), len(PHONE_FIELDS))
+        return pd.DataFrame(dict(zip(PHONE_FIELDS, arrays)), index=values.index)
+
+    def parse_company_names(self, values: pd.Series, compute: Optional[Callable[[List], List]] = None) -> pd.DataFrame:
+        """
+        Parse a whole company column into name and legal suffix columns (COMPANY_FIELDS), each
+        distinct value once, as parse_company_name would. `compute` as for parse_phone_numbers.
+        """
+        return self.map_unique_fields(values, "parse_company_name", COMPANY_FIELDS, compute)
 
     def parse_company_name(self, name_str: str) -> Tuple[str, str]:
         original_name = str(name_str).strip()
-        matches = list(self.legal_suffix_regex.finditer(original_name))
-        if matches:
-            last_match = matches[-1]
-            split_point = last_match.start()
-            name = original_name[:split_point].strip().rstrip('.,').strip()
-            legal = last_match.group(1).strip()
-            # Also capture the trailing punctuation/whitespace that was matched by the second group in the regex
-            trailing_punct_ws = last_match.group(2).strip()
-            legal = legal + trailing_punct_ws if trailing_punct_ws else legal # Re-attach if present
-            return name, legal
+        # The longest suffix that ends the name and does not start inside a word wins
+        span = find_legal_suffix(self.legal_suffix_index, original_name)
+        if span is not None:
+            start, end = span
+            name = original_name[:start].strip().rstrip('.,').strip()
+            return name, original_name[start:end]
         return original_name, ""
@@ -0,0 +1,71 @@
+import re
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+class MultiPatternMatcher:
+    """
+    Evaluates a list of compiled regexes against a value in a single scan.
+
+    Every pattern becomes an optional lookahead with its own named group inside one combined
+    regex, so a single `match` call at position 0 reports which of the patterns `search` would find.
+    An optional prefilter regex lets values that cannot match any pattern skip the scan entirely.
+    """
+
+    def __init__(self, patterns: List[re.Pattern], prefilter: Optional[re.Pattern] = None):
+        self.patterns = list(patterns)
+        self.prefilter = prefilter
+
+        branches = []
+        self._group_names = []
+        for i, regex in enumerate(self.patterns):
+            name = f"_mp{i}"
+            source = regex.pattern
+            if regex.flags & re.IGNORECASE:
+                source = f"(?i:{source})"
+            # `search` semantics: anchored patterns are only tried at the start, the rest anywhere
+            lead = "" if source.startswith("^") else "(?s:.*?)"
+            branches.append(f"(?:(?=(?P<{name}>{lead}{source})))?")
+            self._group_names.append(name)
+        self.combined_regex = re.compile("".join(branches))
+        self._group_indices = [self.combined_regex.groupindex[name] for name in self._group_names]
+        # Without capturing groups of their own, pattern i owns group i + 1 and counting can use groups()
+        self._contiguous_groups = self._group_indices == list(range(1, len(self.patterns) + 1))
+
+    def matches(self, value: str) -> Tuple[bool, ...]:
+        """Return one flag per pattern telling whether it matches `value`."""
+        if self.prefilter is not None and not self.prefilter.search(value):
+            return (False,) * len(self.patterns)
+        m = self.combined_regex.match(value)
+        return tuple(m.group(i) is not None for i in self._group_indices)
+
+    def count(self, value: str) -> int:
+        """Number of patterns that match `value`."""
+        if self.prefilter is not None and not self.prefilter.search(value):
+            return 0
+        return self._count_unfiltered(value)
+
+    def _count_unfiltered(self, value: str) -> int:
+        m = self.combined_regex.match(value)
+        if self._contiguous_groups:
+            return len(self._group_indices) - m.groups().count(None)
+        return sum(1 for i in self._group_indices if m.group(i) is not None)
+
+    def count_series(self, values: pd.Series) -> np.ndarray:
+        """
+        Vectorized `count` over a Series of strings.
+
+        Args:
+            values (pd.Series): A series of already stringified values.
+
+        Returns:
+            np.ndarray: Number of matching patterns per value.
+        """
+        counts = np.zeros(len(values), dtype=np.int64)
+        if self.prefilter is not None:
+            candidates = values.str.contains(self.prefilter).to_numpy(dtype=bool)
+        else:
+            candidates = np.ones(len(values), dtype=bool)
+        if candidates.any():
+            counts[candidates] = [self._count_unfiltered(value) for value in values.to_numpy()[candidates]]
+        return counts
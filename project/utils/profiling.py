@@ -0,0 +1,72 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+class StageProfiler:
+    """
+    Collects per-stage wall/CPU time, per-column classification timings and cache statistics
+    for one pipeline run. Stages entered repeatedly (e.g. once per chunk) are accumulated.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.columns = []
+        self.caches = {}
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(name, {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0, "rows": 0})
+            entry["wall_s"] += time.perf_counter() - wall
+            entry["cpu_s"] += time.process_time() - cpu
+            entry["calls"] += 1
+            entry["rows"] += rows or 0
+
+    def record_column(self, name: str, seconds: float, rows: int, result: dict):
+        """Timing and outcome of classifying one column (`rows` values examined)."""
+        self.columns.append({
+            "column": str(name),
+            "seconds": seconds,
+            "rows": rows,
+            "rows_per_sec": rows / seconds if seconds else None,
+            **{k: result[k] for k in ("label", "confidence", "sample_size", "error") if k in result},
+        })
+
+    def record_cache(self, name: str, hits: int, misses: int, size: Optional[int] = None):
+        lookups = hits + misses
+        self.caches[name] = {"hits": hits, "misses": misses, "size": size,
+                             "hit_rate": hits / lookups if lookups else None}
+
+    def report(self) -> dict:
+        stages = {}
+        for name, entry in self.stages.items():
+            stages[name] = {**entry, "rows_per_sec": entry["rows"] / entry["wall_s"] if entry["rows"] and entry["wall_s"] else None}
+        return {
+            "total_wall_s": time.perf_counter() - self._start_wall,
+            "total_cpu_s": time.process_time() - self._start_cpu,
+            "stages": stages,
+            "columns": self.columns,
+            "caches": self.caches,
+        }
+
+    def write(self, path: str) -> dict:
+        report = self.report()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=float)
+        return report
+
+    def print_summary(self, report: Optional[dict] = None):
+        report = report or self.report()
+        print(f"[PROFILE] Total: {report['total_wall_s']:.3f}s wall, {report['total_cpu_s']:.3f}s CPU")
+        for name, entry in report["stages"].items():
+            throughput = f", {entry['rows_per_sec']:,.0f} rows/s" if entry["rows_per_sec"] else ""
+            print(f"[PROFILE]   {name.ljust(20)} {entry['wall_s']:8.3f}s wall {entry['cpu_s']:8.3f}s CPU{throughput}")
+        for name, entry in report["caches"].items():
+            if entry["hit_rate"] is not None:
+                print(f"[PROFILE]   cache {name}: {entry['hit_rate']:.1%} hit rate ({entry['hits']} hits, {entry['misses']} misses)")
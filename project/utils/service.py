@@ -0,0 +1,160 @@
+import json
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import pandas as pd
+
+from project.utils.parser_utils import COMPANY_FIELDS, PHONE_FIELDS, ParserUtils
+
+# Parsed output fields per semantic type, named as in parser.py's output file
+PARSERS = {
+    "PhoneNumber": ("parse_phone_number", PHONE_FIELDS),
+    "CompanyName": ("parse_company_name", COMPANY_FIELDS),
+}
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+class RequestError(ValueError):
+    """A malformed request; reported to the client as HTTP 400."""
+
+class ClassificationService:
+    """
+    Keeps a Classifier and a ParserUtils warm for the life of the process and answers batched
+    classify/parse requests with them.
+
+    Requests and responses are plain dicts (decoded JSON). Calls are serialized with a lock, since
+    the ParserUtils result caches are not thread-safe and the work is CPU-bound anyway.
+    """
+
+    def __init__(self, classifier, parser_utils: Optional[ParserUtils] = None):
+        self.classifier = classifier
+        self.parser_utils = parser_utils if parser_utils is not None else ParserUtils()
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Run one tiny request so lazily built state (patterns, phone metadata) exists before the first client."""
+        self.classify({"columns": {"warm_up": ["+1 475-216-2114", "Tresata pvt ltd."]}, "parse": True})
+
+    def parse(self, request: dict) -> dict:
+        """
+        Parse values of a known type.
+
+        Request: {"type": "PhoneNumber" | "CompanyName", "values": [...]}
+        Response: {"parsed_...": [...], "parsed_...": [...]}, one entry per value.
+        """
+        label = request.get("type")
+        if label not in PARSERS:
+            raise RequestError(f"'type' must be one of {sorted(PARSERS)}")
+        with self._lock:
+            return self._parse_values(label, _values(request.get("values")))
+
+    def classify(self, request: dict) -> dict:
+        """
+        Classify a batch of columns, optionally parsing the phone and company columns.
+
+        Request: {"columns": {name: [values], ...}, "max_sample_size": int (optional),
+                  "parse": bool (optional, default false)}
+        Response: {"columns": {name: {"label", "confidence", ["parsed_..." lists]} or {"error"}}}
+        """
+        columns = request.get("columns")
+        if not isinstance(columns, dict):
+            raise RequestError("'columns' must be an object mapping column names to lists of values")
+        columns = {name: _values(values) for name, values in columns.items()}
+        max_sample_size = request.get("max_sample_size")
+        results = {}
+        with self._lock:
+            for name, values in columns.items():
+                try:
+                    if max_sample_size:
+                        result = self.classifier.classify_column_sampled(values, max_sample_size=int(max_sample_size))
+                    else:
+                        label, confidence = self.classifier.classify_column(values)
+                        result = {"label": label, "confidence": confidence}
+                    result["confidence"] = float(result["confidence"])
+                    if request.get("parse") and result["label"] in PARSERS:
+                        result.update(self._parse_values(result["label"], values))
+                except Exception as e:
+                    result = {"error": str(e)}
+                results[name] = result
+        return {"columns": results}
+
+    def _parse_values(self, label: str, values: pd.Series) -> dict:
+        method_name, fields = PARSERS[label]
+        parsed = self.parser_utils.map_unique_fields(values, method_name, fields)
+        return {field: parsed[field].tolist() for field in fields}
+
+def _values(values) -> pd.Series:
+    if not isinstance(values, list):
+        raise RequestError("values must be a list")
+    if not all(value is None or isinstance(value, (str, int, float)) for value in values):
+        raise RequestError("values must be strings, numbers, booleans or null")
+    return pd.Series(values, dtype=object)
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP: POST /classify, POST /parse, GET /health."""
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        routes = {"/classify": self.server.service.classify, "/parse": self.server.service.parse}
+        if self.path not in routes:
+            self._send(404, {"error": f"unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length > MAX_REQUEST_BYTES:
+                raise RequestError(f"request body larger than {MAX_REQUEST_BYTES} bytes")
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise RequestError("request body must be a JSON object")
+            self._send(200, routes[self.path](request))
+        except (RequestError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            # Never drop the connection without an answer
+            self.log_error("error handling %s: %r", self.path, e)
+            self._send(500, {"error": f"internal error: {e}"})
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: dict):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service: ClassificationService, quiet: bool = False):
+        self.service = service
+        self.quiet = quiet
+        super().__init__(address, ServiceRequestHandler)
+
+class UnixServiceHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ClassificationService, quiet: bool = False):
+        self.service = service
+        self.quiet = quiet
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, ServiceRequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)